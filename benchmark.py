@@ -0,0 +1,368 @@
+# Showdown Data
+import src.showdown as showdown
+
+# Speed Tier Engines
+import src.engine as engine
+
+# Species Reports
+import src.report as report
+
+# Output Writers
+import src.output as output
+
+# EV/IV Breakpoint Solver
+import src.solver as solver
+
+# Utility Functions
+import src.util as util
+
+# Speed Tier Index
+from src.tiers import SpeedTierIndex
+
+# Render Cache
+from src.render import RenderCache
+
+# JSON library
+import json as JSON
+
+# Argument Parser
+import argparse
+
+# Timing, Platform Libraries
+import time, platform, io
+
+# System Library
+import sys
+
+# Results file format version
+RESULTS_VERSION = 1
+
+# Phases which are timed for each workload
+PHASES = ["load", "tiers", "reports", "serialize"]
+
+# Default workload matrix
+DEFAULT_SPECIES = [100, 1000]
+DEFAULT_COMBINATIONS = [4, 32]
+DEFAULT_STAGES = [1, 3]
+DEFAULT_LEVELS = [50, 100]
+
+# Regressions smaller than this (seconds) are ignored as noise
+MIN_REGRESSION = 0.001
+
+
+def build_combinations(count):
+    # Natures to cycle through
+    natures = [util.NATURE_POSITIVE, util.NATURE_NEUTRAL, util.NATURE_NEGATIVE]
+
+    # Stat combinations
+    combinations = []
+
+    # Loop over the evs, ivs, natures (deterministic order)
+    for evs in range(252, -1, -4):
+        for ivs in [31, 0]:
+            for nature in natures:
+                # Enough combinations generated
+                if len(combinations) == count:
+                    return combinations
+
+                # Add the combination to the list
+                combinations.append({"evs": evs, "ivs": ivs, "nature": nature})
+
+    # Return all possible combinations
+    return combinations
+
+
+def time_phase(function, repeats):
+    # Fastest time, last result
+    best = None
+    result = None
+
+    # Loop over the repeats
+    for _ in range(repeats):
+        # Time the function call
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+
+        # Keep the fastest time
+        if best == None or elapsed < best:
+            best = elapsed
+
+    # Return the fastest time, and the result
+    return best, result
+
+
+def run_workload(pokemon, species, combinations, stages, level, engine_name, repeats):
+    # Workload species subset
+    keys = list(pokemon.keys())[:species]
+    subset = {key: pokemon[key] for key in keys}
+
+    # Workload stat combinations, stages
+    combination_list = build_combinations(combinations)
+    stage_list = list(range(stages))
+
+    # Load the showdown data (from the snapshot)
+    def load():
+        return len(showdown.get_showdown_data()[1])
+
+    # Build the speed tiers
+    def tiers():
+        return engine.build_speed_tiers(
+            subset, level, combination_list, stage_list, engine=engine_name
+        )
+
+    # Build the reports for every species
+    def reports():
+        # Clear the breakpoints, sections memoised by the previous repeat
+        solver.ev_breakpoints.cache_clear()
+        solver.iv_breakpoints.cache_clear()
+        solver.spread_breakpoints.cache_clear()
+        report_index = SpeedTierIndex(speed_tiers)
+
+        return [
+            report.build_species_report(subset[key], report_index, level) for key in keys
+        ]
+
+    # Serialise the tiers, reports to json / markdown
+    def serialize():
+        # Tier outputs
+        output.write_tiers_json(speed_tiers, io.StringIO(), True, 2)
+        output.write_tiers_markdown(speed_tiers, tier_index.stats, io.StringIO())
+
+        # Rendered benchmarks, shared by every report (as in the report writer)
+        render = RenderCache(True, 2)
+
+        # Species report outputs
+        for species_report in species_reports:
+            render.encode(species_report)
+            report.build_species_markdown(species_report, render)
+
+    # Time each of the phases
+    timings = {}
+    timings["load"], _ = time_phase(load, repeats)
+    timings["tiers"], speed_tiers = time_phase(tiers, repeats)
+
+    # Index used by the reports
+    tier_index = SpeedTierIndex(speed_tiers)
+
+    timings["reports"], species_reports = time_phase(reports, repeats)
+    timings["serialize"], _ = time_phase(serialize, repeats)
+
+    # Return the workload results
+    return {
+        "species": len(keys),
+        "combinations": len(combination_list),
+        "stages": len(stage_list),
+        "level": level,
+        "entries": sum(len(tier) for tier in speed_tiers.values()),
+        "phases": timings,
+    }
+
+
+def get_workload_key(result):
+    # Workload parameters, used to match baseline results
+    return (
+        result["species"],
+        result["combinations"],
+        result["stages"],
+        result["level"],
+    )
+
+
+def compare_results(results, baseline, threshold):
+    # Timings from different engines are not comparable
+    if results["engine"] != baseline.get("engine"):
+        raise ValueError(
+            f"Baseline engine '{baseline.get('engine')}' does not match the current engine '{results['engine']}'!"
+        )
+
+    # Baseline results, by workload
+    baseline_results = {
+        get_workload_key(result): result for result in baseline["results"]
+    }
+
+    # Phases which are slower than the baseline
+    regressions = []
+
+    # Workloads whose tiers differ from the baseline (e.g. a different pokedex)
+    mismatched = []
+
+    # Loop over the current results
+    for result in results["results"]:
+        # Workload is not in the baseline
+        key = get_workload_key(result)
+        if key not in baseline_results:
+            continue
+
+        # Workload built a different number of tier entries, skip it
+        if result["entries"] != baseline_results[key].get("entries"):
+            mismatched.append(key)
+            continue
+
+        # Loop over the phases
+        for phase in PHASES:
+            # Current, baseline timings
+            current = result["phases"][phase]
+            previous = baseline_results[key]["phases"][phase]
+
+            # Slower than the threshold allows
+            if current > previous * (1 + threshold) and current - previous > MIN_REGRESSION:
+                regressions.append(
+                    {
+                        "workload": key,
+                        "phase": phase,
+                        "baseline": previous,
+                        "current": current,
+                        "change": (current - previous) / previous,
+                    }
+                )
+
+    # Return the regressions, mismatched workloads
+    return regressions, mismatched
+
+
+def parse_list(value):
+    # Comma separated list of integers
+    return [int(item) for item in value.split(",") if item != ""]
+
+
+def parse_args(args):
+    # Create the argument parser
+    parser = argparse.ArgumentParser(description="Speed Tier Generator Benchmarks")
+
+    # Workload matrix
+    parser.add_argument(
+        "--species",
+        type=parse_list,
+        default=DEFAULT_SPECIES,
+        help="Comma separated numbers of species",
+    )
+    parser.add_argument(
+        "--combinations",
+        type=parse_list,
+        default=DEFAULT_COMBINATIONS,
+        help="Comma separated numbers of stat combinations",
+    )
+    parser.add_argument(
+        "--stages",
+        type=parse_list,
+        default=DEFAULT_STAGES,
+        help="Comma separated numbers of stages",
+    )
+    parser.add_argument(
+        "--levels",
+        type=parse_list,
+        default=DEFAULT_LEVELS,
+        help="Comma separated levels",
+    )
+
+    # Benchmark settings
+    parser.add_argument(
+        "--engine",
+        choices=engine.ENGINES,
+        default=engine.ENGINE_PYTHON,
+        help="Engine used to build the speed tiers (default: python)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Runs per phase (fastest is kept)"
+    )
+
+    # Results files
+    parser.add_argument(
+        "--output", default="benchmark.json", help="Path to write the results to"
+    )
+    parser.add_argument("--baseline", help="Path to baseline results to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed slowdown compared to the baseline (default: 0.1, i.e. 10%%)",
+    )
+
+    # Parse the arguments
+    return parser.parse_args(args)
+
+
+# Main Process
+if __name__ == "__main__":
+    # Parse the script arguments
+    ARGS = parse_args(sys.argv[1:])
+
+    # Get showdown data files
+    MOVES, POKEMON = showdown.get_showdown_data()
+
+    # Benchmark results
+    results = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "engine": ARGS.engine,
+        "repeats": ARGS.repeats,
+        "results": [],
+    }
+
+    # Loop over the workload matrix
+    for level in ARGS.levels:
+        for species in ARGS.species:
+            for combinations in ARGS.combinations:
+                for stages in ARGS.stages:
+                    # Run the workload
+                    result = run_workload(
+                        POKEMON,
+                        species,
+                        combinations,
+                        stages,
+                        level,
+                        ARGS.engine,
+                        ARGS.repeats,
+                    )
+
+                    # Add the workload results
+                    results["results"].append(result)
+
+                    # Build the timings string
+                    timings = ", ".join(
+                        f"{phase} {result['phases'][phase] * 1000:.1f}ms"
+                        for phase in PHASES
+                    )
+
+                    print(
+                        f"Level {level}, {species} species, {combinations} combinations, {stages} stages: {timings}"
+                    )
+
+    # Write the results file
+    with open(ARGS.output, "w+") as file:
+        JSON.dump(results, file, indent=2)
+
+    # Baseline is set
+    if ARGS.baseline != None:
+        # Open the baseline results file
+        with open(ARGS.baseline, "r") as file:
+            baseline = JSON.load(file)
+
+        try:
+            # Compare the results to the baseline
+            regressions, mismatched = compare_results(results, baseline, ARGS.threshold)
+        except ValueError as e:
+            print(f"Unable to compare to the baseline: {e}")
+            sys.exit(2)
+
+        # Loop over the mismatched workloads
+        for workload in mismatched:
+            print(
+                f"Skipped workload {workload}: the baseline workload built different tiers"
+            )
+
+        # Loop over the regressions
+        for regression in regressions:
+            print(
+                f"Regression in {regression['phase']} for workload {regression['workload']}: "
+                f"{regression['baseline'] * 1000:.1f}ms -> {regression['current'] * 1000:.1f}ms "
+                f"(+{regression['change'] * 100:.0f}%)"
+            )
+
+        # Fail if any phase regressed
+        if len(regressions) > 0:
+            sys.exit(1)
+
+        print("No regressions compared to the baseline.")
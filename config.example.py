@@ -20,6 +20,12 @@ JSON_INDENT = 2
 # Output folder path
 OUTPUT_FOLDER = 'out'
 
+# Cache folder path, used to skip
+# recomputing tiers and reports which
+# have not changed since the last run
+# Set to 'None' to disable the cache
+CACHE_FOLDER = 'cache'
+
 # Output json file path
 OUTPUT_JSON = 'tiers.json'
 
@@ -30,9 +36,43 @@ OUTPUT_JSON = 'tiers.json'
 # [species-name].json
 SPECIES_JSON = True
 
+# If set to true, species json reports use
+# the compact schema, where the benchmarks
+# and speed ties reference the stats in the
+# speed tiers file instead of copying them
+# (see report.expand_species_report)
+SPECIES_JSON_COMPACT = False
+
 # Output markdown file path
 OUTPUT_MD = 'TIERS.MD'
 
+# Output binary tier file path, which can
+# be memory-mapped and searched by stat
+# without parsing (see src/tierfile.py)
+# Set to 'None' to disable
+OUTPUT_BINARY = 'tiers.bin'
+
+# Usage-weighted tiers file paths (--usage)
+# Set either to 'None' to disable
+OUTPUT_USAGE_JSON = 'usage.json'
+OUTPUT_USAGE_MD = 'USAGE.MD'
+
+# SQLite database file path, with indexed
+# tables for the tiers and the reports for
+# the species arguments (or every species
+# with --all). Set to 'None' to disable
+OUTPUT_SQLITE = None
+
+# Tier diff file paths (--diff)
+# Set either to 'None' to disable
+OUTPUT_DIFF_JSON = 'diff.json'
+OUTPUT_DIFF_MD = 'DIFF.MD'
+
+# Outspeed matrix file path (--outspeed), the
+# species / spread labels are written next to
+# it with a .json extension
+OUTPUT_OUTSPEED = 'outspeed.npy'
+
 # If set to true, species-specific
 # report dumping to markdown will be
 # enabled - otherwise, will be disabled
@@ -56,6 +96,12 @@ SORT_SLOWEST_FIRST = False
 # In order to disable one of these arguments, 
 # assign the value to 'None'. 
 
+# Either argument can also be a dict of pokedex
+# field rules, where a species must match any of
+# the values for every field, e.g. 
+# {'gen': [8, 9], 'isNonstandard': [None]}
+# Fields: num, forme, isNonstandard, tags, gen
+
 # Species to include
 INCLUDE_SPECIES = [
     *range(1,1026)
@@ -74,8 +120,40 @@ STAT_COMBINATIONS = [
 
 # Stages which should be 
 # applied to all combinations
+# Negative stages are supported, and stages
+# can be combined with speed modifiers, e.g.
+# {"stage": 1, "modifiers": ["scarf"]}
 STAGES = [
     0, # Neutral
     # 1, # Choice Scarf
     # 2, # Tailwind
-]
\ No newline at end of file
+]
+
+# Speed modifier options (see src/modifiers.py)
+# If set, tiers are generated for every
+# combination of the options below (None
+# meaning no modifier), instead of STAGES
+MODIFIERS = None # {
+#     "stage": [0, 1, -1],
+#     "item": [None, "scarf"],
+#     "field": [None, "tailwind"],
+#     "ability": [None, "swiftswim"],
+#     "status": [None, "paralysis"],
+# }
+
+# Maximum number of modifiers (including the
+# stage) which can be active at the same time
+MAX_ACTIVE_MODIFIERS = 2
+
+# Matrix mode (--matrix) settings
+
+# Levels to generate tiers for
+MATRIX_LEVELS = [50, 100]
+
+# Named stage sets to generate tiers for
+# Output files are named with the level
+# and set name, e.g. tiers-50-boosted.json
+MATRIX_STAGES = {
+    "neutral": [0],
+    "boosted": [0, 1, 2],
+}
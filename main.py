@@ -1,562 +1,626 @@
 # Showdown Data
 import src.showdown as showdown
 
-# Utility Functions
-import src.util as util
+# Speed Tier Engines
+import src.engine as engine
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# Speed Tier Index
+from src.tiers import SpeedTierIndex
+
+# Species Reports
+import src.report as report
+
+# Output Cache
+import src.cache as cache
+
+# Output Writers
+import src.output as output
+
+# Query Server
+import src.server as server
+
+# Phase Profiler
+import src.profiler as profiler
+
+# Outspeed Matrix
+import src.outspeed as outspeed
+
+# Binary Tier Files
+import src.tierfile as tierfile
+
+# Usage Weighted Tiers
+import src.usage as usage
+
+# Tier Diffs
+import src.diff as diff
+
+# Batch Species Queries
+import src.batch as batch
+
+# SQLite Output
+import src.database as database
 
 # Config Functions
 import config as CONFIG
 
-# JSON library
-import json as JSON
-
-# Math Library
-import math
+# Argument Parser
+import argparse
 
 # OS Library
 import sys, os
 
 
-# Check if the current stat is a jump stat
-def is_jump_stat(last_value, current_value):
-    # Return true if the last value was not none, and difference between
-    # the last value and the current value (regardless of signedness) is
-    # greater than one (i.e. 2+ stat jumps between values)
-    return last_value != None and abs(last_value - current_value) > 1
+def log(message):
+    # Keep stdout clear when the tiers are being written to it
+    if ARGS.stdout != None:
+        print(message, file=sys.stderr)
+    else:
+        print(message)
+
+
+def write_tier_files(speed_tiers, tiers, json_filename, md_filename, bin_filename=None):
+    # Tier json writer
+    def write_json(file):
+        output.write_tiers_json(
+            speed_tiers, file, sort_keys=CONFIG.JSON_SORT_KEYS, indent=CONFIG.JSON_INDENT
+        )
 
+    # Tier markdown writer
+    def write_md(file):
+        output.write_tiers_markdown(speed_tiers, tiers, file)
 
-def build_spread_string(ivs, evs, nature, species=None):
-    # Start building the combo string
+    # Output json is not none
+    if json_filename != None:
+        # Build the path to the json file
+        json_path = os.path.join(CONFIG.OUTPUT_FOLDER, json_filename)
 
-    # Add the ivs/evs
-    spread_string = f"{ivs}/{evs}"
+        # Stream the json report file, unless unchanged
+        with PROFILER.phase(f"write:{json_filename}"):
+            PROFILER.count("bytes_written", output.write_output(json_path, write_json))
 
-    # Positive nature, add plus to string
-    if nature == CONFIG.NATURE_POSITIVE:
-        spread_string = f"{spread_string}+"
-    # Negative nature, add minus to string
-    elif nature == CONFIG.NATURE_NEGATIVE:
-        spread_string = f"{spread_string}-"
+    # Output markdown is not none
+    if md_filename != None:
+        # Build the path to the md file
+        md_path = os.path.join(CONFIG.OUTPUT_FOLDER, md_filename)
+
+        # Stream the md report file, unless unchanged
+        with PROFILER.phase(f"write:{md_filename}"):
+            PROFILER.count("bytes_written", output.write_output(md_path, write_md))
+
+    # Output binary is not none
+    if bin_filename != None:
+        # Build the path to the binary file
+        bin_path = os.path.join(CONFIG.OUTPUT_FOLDER, bin_filename)
+
+        # Stream the binary tier file, unless unchanged
+        with PROFILER.phase(f"write:{bin_filename}"):
+            PROFILER.count(
+                "bytes_written",
+                output.write_output(
+                    bin_path,
+                    lambda file: tierfile.write_tiers_binary(speed_tiers, file),
+                    encoding=None,
+                ),
+            )
 
-    # Species is defined
-    if species:
-        # Add the species name to the combo string
-        spread_string = f"{spread_string} {species}"
 
-    # Return spread string
-    return spread_string
+def write_usage_files(usage_path):
+    # Stream the species from the usage stats file
+    with PROFILER.phase("usage"):
+        with open(usage_path, "r", encoding="utf8") as file:
+            usage_tiers = usage.build_usage_tiers(file, POKEMON, CONFIG.LEVEL)
 
+    # Get all of the usage stats, sorted based on the sort config
+    stats = sorted(usage_tiers["tiers"].keys(), reverse=CONFIG.SORT_SLOWEST_FIRST)
 
-# Main Process
-if __name__ == "__main__":
-    # Get showdown data files
-    MOVES, POKEMON = showdown.get_showdown_data()
-
-    # This table will be indexed with the following:
-    # key: Speed Number (e.g. 167)
-    # value: Pokemon which reach this stat (with conditions) (e.g. 252+ Mega Kangaskhan)
-    speed_tiers = {}
-
-    # Species Inclusions, Exclusions
-    exclude_species = CONFIG.EXCLUDE_SPECIES
-    include_species = CONFIG.INCLUDE_SPECIES
-
-    # Loop over all of the Pokemon
-    for pokemon in POKEMON:
-        # Get the data for the species
-        pokemon_data = POKEMON[pokemon]
-        species = pokemon_data["name"]
-        number = pokemon_data["num"]
-
-        # If the exclusion list is set, and species is in the set
-        if exclude_species != None and number in exclude_species:
-            continue # Skip this species
-
-        # If the inclusion list is set, and species is not in the set
-        if include_species != None and number not in include_species:
-            continue # Skip this species
-
-        # Dereference values
-        base_stats = pokemon_data["baseStats"]
-        base_speed = base_stats["spe"]
-
-        # Loop over all of the stat combinations
-        for combination in CONFIG.STAT_COMBINATIONS:
-            # Dereference values
-            ivs = combination["ivs"]
-            evs = combination["evs"]
-            nature = combination["nature"]
-
-            # Calculate the speed stat for the combination
-            speed_stat = util.calculate_stat(
-                base_speed,
-                CONFIG.LEVEL,
-                combination["ivs"],
-                combination["evs"],
-                combination["nature"],
+    # Output file names
+    json_filename = getattr(CONFIG, "OUTPUT_USAGE_JSON", "usage.json")
+    md_filename = getattr(CONFIG, "OUTPUT_USAGE_MD", "USAGE.MD")
+
+    # Output json is not none
+    if json_filename != None:
+        # Build the path to the json file
+        json_path = os.path.join(CONFIG.OUTPUT_FOLDER, json_filename)
+
+        # Stream the usage json file, unless unchanged
+        with PROFILER.phase(f"write:{json_filename}"):
+            PROFILER.count(
+                "bytes_written",
+                output.write_output(
+                    json_path,
+                    lambda file: usage.write_usage_json(
+                        usage_tiers, file, CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT
+                    ),
+                ),
+            )
+
+    # Output markdown is not none
+    if md_filename != None:
+        # Build the path to the md file
+        md_path = os.path.join(CONFIG.OUTPUT_FOLDER, md_filename)
+
+        # Stream the usage md file, unless unchanged
+        with PROFILER.phase(f"write:{md_filename}"):
+            PROFILER.count(
+                "bytes_written",
+                output.write_output(
+                    md_path, lambda file: usage.write_usage_markdown(usage_tiers, stats, file)
+                ),
             )
 
-            # Start building the combo string
+    log(f"Generated usage tiers from {usage_path} ...")
 
-            # Add the evs
-            combo_string = build_spread_string(ivs, evs, nature, species)
 
-            # Loop over the stages
-            for stage in CONFIG.STAGES:
-                # Copy combo data for stage
-                stage_stat = speed_stat
-                stage_string = combo_string
+def run_batch(path, tier_index):
+    # Read the queries from stdin, or the file
+    file = sys.stdin if path == "-" else open(path, "r", encoding="utf8")
 
-                # Stage is greater than zero
-                if stage > 0:
-                    # Apply the stage modifier to the string
-                    stage_string = f"+{stage} {stage_string}"
+    try:
+        # Parse the queries as they are read
+        queries = batch.iter_queries(file, POKEMON)
 
-                    # Calculate the stage modifier
-                    stage_modifier = 1 + (stage * 0.5)
+        # Stream the results as they complete
+        for line in batch.generate_results(queries, tier_index, CONFIG.LEVEL, ARGS.jobs):
+            sys.stdout.write(f"{line}\n")
+            sys.stdout.flush()
+    finally:
+        # Close the queries file
+        if file != sys.stdin:
+            file.close()
 
-                    # Apply stage modifier to the stat
-                    stage_stat = math.floor(stage_stat * stage_modifier)
 
-                # If the stat is in the tiers
-                if stage_stat in speed_tiers:
-                    # Add the combo string to the speed tiers
-                    speed_tiers[stage_stat].append(stage_string)
-                else:
-                    # Create a new entry with the speed tier
-                    speed_tiers[stage_stat] = [stage_string]
+def run_diff(old_path, new_path):
+    # Build / load the tiers for both inputs
+    with PROFILER.phase("diff"):
+        old_tiers = diff.load_tiers(old_path, POKEMON, CONFIG, ARGS.engine)
+        new_tiers = diff.load_tiers(new_path, POKEMON, CONFIG, ARGS.engine)
 
-    # Get all of the speed stats
-    tiers = list(speed_tiers.keys())
+        # Merge-join the tiers
+        changes = diff.diff_tiers(old_tiers, new_tiers)
 
-    # Sort the tiers based on the sort config
-    tiers.sort(reverse=CONFIG.SORT_SLOWEST_FIRST)
+    # Write the changes to stdout, instead of files
+    if ARGS.stdout == "json":
+        diff.write_diff_json(changes, sys.stdout, CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT)
+        return
+    if ARGS.stdout == "md":
+        diff.write_diff_markdown(changes, sys.stdout)
+        return
 
     # Ensure the output directory exists
     os.makedirs(CONFIG.OUTPUT_FOLDER, exist_ok=True)
 
+    # Output file names
+    json_filename = getattr(CONFIG, "OUTPUT_DIFF_JSON", "diff.json")
+    md_filename = getattr(CONFIG, "OUTPUT_DIFF_MD", "DIFF.MD")
+
     # Output json is not none
-    if CONFIG.OUTPUT_JSON != None:
-        # Generate a json string from the table
-        output = JSON.dumps(
-            speed_tiers, sort_keys=CONFIG.JSON_SORT_KEYS, indent=CONFIG.JSON_INDENT
+    if json_filename != None:
+        # Stream the diff json file, unless unchanged
+        output.write_output(
+            os.path.join(CONFIG.OUTPUT_FOLDER, json_filename),
+            lambda file: diff.write_diff_json(
+                changes, file, CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT
+            ),
         )
 
-        # Build the path to the json file
-        json_path = os.path.join(CONFIG.OUTPUT_FOLDER, CONFIG.OUTPUT_JSON)
+    # Output markdown is not none
+    if md_filename != None:
+        # Stream the diff md file, unless unchanged
+        output.write_output(
+            os.path.join(CONFIG.OUTPUT_FOLDER, md_filename),
+            lambda file: diff.write_diff_markdown(changes, file),
+        )
 
-        # Open the json report file
-        with open(json_path, "w+") as file:
-            # Write the data to the file
-            file.write(output)
+    log(
+        f"{len(changes['tiers'])} tiers changed: {len(changes['added'])} added, "
+        f"{len(changes['removed'])} removed, {len(changes['moved'])} moved ..."
+    )
+
+
+def run_matrix():
+    # Levels, named stage sets to generate tiers for
+    levels = getattr(CONFIG, "MATRIX_LEVELS", [CONFIG.LEVEL])
+    stage_sets = getattr(CONFIG, "MATRIX_STAGES", {"stages": STAGES})
+
+    # Build the speed tiers for every cell in a single pass
+    with PROFILER.phase("tiers"):
+        matrix = engine.build_speed_tiers_matrix(
+            POKEMON,
+            levels,
+            CONFIG.STAT_COMBINATIONS,
+            stage_sets,
+            CONFIG.INCLUDE_SPECIES,
+            CONFIG.EXCLUDE_SPECIES,
+            engine=ARGS.engine,
+        )
 
-    # Output markdown is not none
-    if CONFIG.OUTPUT_MD != None:
-        # Content string array
-        content = ["| Speed | Amount | Benchmarks |", "| ----- | ------ | ---------- |"]
+    # Species included in the speed tiers
+    species_count = len(
+        engine.filter_species(POKEMON, CONFIG.INCLUDE_SPECIES, CONFIG.EXCLUDE_SPECIES)
+    )
+
+    # Record the tier counters (across every cell)
+    PROFILER.count("species", species_count)
+    PROFILER.count(
+        "combinations",
+        species_count
+        * len(CONFIG.STAT_COMBINATIONS)
+        * len(levels)
+        * sum(len(stages) for stages in stage_sets.values()),
+    )
+    PROFILER.count("tiers", sum(len(speed_tiers) for speed_tiers in matrix.values()))
 
-        # Loop over the sorted array
-        for tier in tiers:
-            # Get the data for the speed tier
-            tier_data = speed_tiers[tier]
+    # Ensure the output directory exists
+    os.makedirs(CONFIG.OUTPUT_FOLDER, exist_ok=True)
 
-            # Get the number of benchmarks in the tier
-            tier_count = len(tier_data)
+    # Loop over the matrix cells
+    for (level, name), speed_tiers in matrix.items():
+        # Get all of the speed stats, sorted based on the sort config
+        tiers = sorted(speed_tiers.keys(), reverse=CONFIG.SORT_SLOWEST_FIRST)
+
+        # Write the outputs for the cell
+        write_tier_files(
+            speed_tiers,
+            tiers,
+            output.get_cell_filename(CONFIG.OUTPUT_JSON, level, name),
+            output.get_cell_filename(CONFIG.OUTPUT_MD, level, name),
+            output.get_cell_filename(
+                getattr(CONFIG, "OUTPUT_BINARY", None), level, name
+            ),
+        )
 
-            # Join the tier benchmarks array
-            benchmarks = ", ".join(tier_data)
+        log(f"Generated tiers for level {level}, stages '{name}' ...")
+
+
+def parse_args(args):
+    # Create the argument parser
+    parser = argparse.ArgumentParser(description="Pokemon Speed Tier Generator")
+
+    # Species to generate reports for
+    parser.add_argument(
+        "species", nargs="*", help="Species keys to generate reports for"
+    )
+
+    # Speed tier engine
+    parser.add_argument(
+        "--engine",
+        choices=engine.ENGINES,
+        default=engine.ENGINE_PYTHON,
+        help="Engine used to build the speed tiers (default: python)",
+    )
+
+    # Generate reports for every species
+    parser.add_argument(
+        "--all", action="store_true", help="Generate reports for every species"
+    )
+
+    # Search every ivs x evs x nature spread
+    parser.add_argument(
+        "--spreads",
+        action="store_true",
+        help="Add every minimal iv / ev / nature spread to the species reports",
+    )
+
+    # Number of report worker processes
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for species reports (0 uses all cpus)",
+    )
+
+    # Refresh the showdown data files
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Check the Showdown server for updated data files",
+    )
+
+    # Disable the output cache
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute all tiers and reports, ignoring the cache",
+    )
+
+    # Write the tiers to stdout
+    parser.add_argument(
+        "--stdout",
+        choices=["json", "md"],
+        help="Write the speed tiers to stdout in the given format, instead of files",
+    )
+
+    # Batch species queries
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="Read species queries line by line from a file (or stdin), and write the reports to stdout as ndjson",
+    )
+
+    # Serve the tiers, species reports over http
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve the speed tiers and species reports over a local http api",
+    )
+
+    # Query server address
+    parser.add_argument(
+        "--host", default=server.DEFAULT_HOST, help="Query server host"
+    )
+    parser.add_argument(
+        "--port", type=int, default=server.DEFAULT_PORT, help="Query server port"
+    )
+
+    # Generate tiers for every level / stage set in the config
+    parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Generate tiers for each of the MATRIX_LEVELS and MATRIX_STAGES",
+    )
+
+    # Smogon chaos usage stats file
+    parser.add_argument(
+        "--usage",
+        metavar="PATH",
+        help="Also write usage-weighted tiers from a Smogon chaos usage stats file",
+    )
+
+    # Compare the tiers for two inputs
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Write the tier changes between two inputs (config .py, pokedex .json, tiers .json or .bin)",
+    )
+
+    # Build the all-pairs outspeed matrix
+    parser.add_argument(
+        "--outspeed",
+        action="store_true",
+        help="Write the all-pairs outspeed matrix to the output folder (requires numpy)",
+    )
+
+    # Profile each phase
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write phase timings, memory and counters to the output folder",
+    )
+
+    # Parse the arguments
+    return parser.parse_args(args)
 
-            # Build the speed tier column string
-            content.append(f"| {tier} | {tier_count} | {benchmarks} |")
 
-        # Combine the array to build the output string
-        output = "\n".join(content)
+# Main Process
+if __name__ == "__main__":
+    # Parse the script arguments
+    ARGS = parse_args(sys.argv[1:])
+
+    # Phase profiler (only records when enabled)
+    PROFILER = profiler.Profiler(enabled=ARGS.profile)
+    PROFILER.start()
+
+    try:
+        # Get showdown data files
+        with PROFILER.phase("get_showdown_data"):
+            MOVES, POKEMON = showdown.get_showdown_data(force=ARGS.refresh)
+
+            # Load the dex now, so it is included in this phase
+            len(POKEMON)
+
+        # Stages / speed modifier sets to apply to all combinations
+        STAGES = modifiers.get_stages(CONFIG)
+
+        # Matrix mode, generate tiers for every level / stage set
+        if ARGS.matrix == True:
+            run_matrix()
+            sys.exit(0)
+
+        # Compare the tiers for two inputs, instead of generating them
+        if ARGS.diff != None:
+            run_diff(*ARGS.diff)
+            sys.exit(0)
+
+        # Build the outspeed matrix, instead of the speed tiers
+        if ARGS.outspeed == True:
+            # Ensure the output directory exists
+            os.makedirs(CONFIG.OUTPUT_FOLDER, exist_ok=True)
+
+            # Generate output matrix file full path
+            outspeed_path = os.path.join(
+                CONFIG.OUTPUT_FOLDER, getattr(CONFIG, "OUTPUT_OUTSPEED", "outspeed.npy")
+            )
 
-        # Build the path to the json file
-        md_path = os.path.join(CONFIG.OUTPUT_FOLDER, CONFIG.OUTPUT_MD)
+            # Compare every species / spread pair, in chunks
+            with PROFILER.phase("outspeed"):
+                outspeed.build_outspeed_matrix(
+                    POKEMON,
+                    CONFIG.LEVEL,
+                    CONFIG.STAT_COMBINATIONS,
+                    STAGES,
+                    outspeed_path,
+                    CONFIG.INCLUDE_SPECIES,
+                    CONFIG.EXCLUDE_SPECIES,
+                )
+
+            log(f"Generated outspeed matrix {outspeed_path} ...")
+            sys.exit(0)
+
+        # Cache folder (None disables the cache)
+        cache_folder = getattr(CONFIG, "CACHE_FOLDER", "cache")
+        if ARGS.no_cache == True:
+            cache_folder = None
+
+        # Hash of the speed tiers inputs
+        tiers_key = None
+
+        # Build the speed tiers
+        with PROFILER.phase("tiers"):
+            # Cache is enabled
+            if cache_folder != None:
+                # Build the speed tiers, reusing unchanged entries
+                speed_tiers, tiers_key = cache.build_speed_tiers_cached(
+                    POKEMON,
+                    CONFIG.LEVEL,
+                    CONFIG.STAT_COMBINATIONS,
+                    STAGES,
+                    CONFIG.INCLUDE_SPECIES,
+                    CONFIG.EXCLUDE_SPECIES,
+                    cache_folder=cache_folder,
+                    engine_name=ARGS.engine,
+                )
+            else:  # Build the speed tiers table with the selected engine
+                speed_tiers = engine.build_speed_tiers(
+                    POKEMON,
+                    CONFIG.LEVEL,
+                    CONFIG.STAT_COMBINATIONS,
+                    STAGES,
+                    CONFIG.INCLUDE_SPECIES,
+                    CONFIG.EXCLUDE_SPECIES,
+                    engine=ARGS.engine,
+                )
+
+        # Species included in the speed tiers
+        species_count = len(
+            engine.filter_species(POKEMON, CONFIG.INCLUDE_SPECIES, CONFIG.EXCLUDE_SPECIES)
+        )
 
-        # Open the md report file
-        with open(md_path, "w+", encoding="utf8") as file:
-            # Write the data to the file
-            file.write(output)
+        # Record the tier counters
+        PROFILER.count("species", species_count)
+        PROFILER.count(
+            "combinations", species_count * len(CONFIG.STAT_COMBINATIONS) * len(STAGES)
+        )
+        PROFILER.count("tiers", len(speed_tiers))
 
-    # Get the script arguments
-    args = sys.argv[1:]
+        # Build the speed tier lookup index
+        tier_index = SpeedTierIndex(speed_tiers)
 
-    # At least one argument
-    if len(args) > 0:
-        # Loop over the arguments
-        for arg in args:
-            # If the arg is a valid species
-            if arg in POKEMON:
-                report = {}
+        # Get all of the speed stats, sorted based on the sort config
+        tiers = tier_index.sorted_stats(reverse=CONFIG.SORT_SLOWEST_FIRST)
 
-                # Dereference species data
-                species = POKEMON[arg]
-                name = species["name"]
+        # Serve the tiers over http, instead of writing outputs
+        if ARGS.serve == True:
+            server.serve(POKEMON, tier_index, CONFIG.LEVEL, ARGS.host, ARGS.port)
+            sys.exit(0)
 
-                print(f"Processing species {name} ...")
+        # Answer batch queries, instead of writing outputs
+        if ARGS.batch != None:
+            run_batch(ARGS.batch, tier_index)
+            sys.exit(0)
 
-                # Get the base stats for the species
-                base_stats = species["baseStats"]
-                base_speed = base_stats["spe"]
+        # Ensure the output directory exists
+        os.makedirs(CONFIG.OUTPUT_FOLDER, exist_ok=True)
 
-                # Positive nature
-                ev_positive = {}
+        # Stream the selected format to stdout
+        if ARGS.stdout == "json":
+            output.write_tiers_json(
+                speed_tiers, sys.stdout, CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT
+            )
+        elif ARGS.stdout == "md":
+            output.write_tiers_markdown(speed_tiers, tiers, sys.stdout)
+        else:  # Stream the formats to the output files
+            write_tier_files(
+                speed_tiers,
+                tiers,
+                CONFIG.OUTPUT_JSON,
+                CONFIG.OUTPUT_MD,
+                getattr(CONFIG, "OUTPUT_BINARY", None),
+            )
 
-                # Neutral nature
-                ev_neutral = {}
+        # Usage stats file is set
+        if ARGS.usage != None:
+            write_usage_files(ARGS.usage)
 
-                # Checks to see if evs change stats
-                # compared to previous (lower) number
-                last_positive = None
-                last_neutral = None
+        # Generate reports for every species
+        if ARGS.all == True:
+            args = list(POKEMON.keys())
+        else:  # Generate reports for the species arguments
+            args = ARGS.species
 
-                # Loop over the range of evs
-                for evs in range(0, 256, 4):
-                    # Calculate positive nature speed stat
-                    speed_positive = util.calculate_stat(
-                        base_speed,
-                        CONFIG.LEVEL,
-                        31,
-                        evs,
-                        CONFIG.NATURE_POSITIVE,
-                    )
-
-                    # If the last stat was null, or new stat is higher
-                    if last_positive == None or last_positive < speed_positive:
-                        # Benchmarks reached
-                        benchmark = []
-
-                        # Check if the current stat is a jump stat
-                        jump_stat = is_jump_stat(last_positive, speed_positive)
-
-                        # Stat is a jump stat
-                        if jump_stat == True:
-                            # Get benchmark speed
-                            benchmark_speed = speed_positive - 2
-
-                            # Speed is in speed tiers list
-                            if benchmark_speed in tiers:
-                                # Add the benchmarks to the list
-                                benchmark += speed_tiers[benchmark_speed]
-
-                        # Get benchmark speed
-                        benchmark_speed = speed_positive - 1
-
-                        # Speed is in speed tiers list
-                        if benchmark_speed in tiers:
-                            # Add the benchmarks to the list
-                            benchmark += speed_tiers[benchmark_speed]
-
-                        # At least one benchmark reached
-                        if len(benchmark) > 0:
-
-                            # Speed ties list
-                            speed_ties = []
-
-                            # Speed tying speed tier in list
-                            if speed_positive in speed_tiers:
-                                speed_ties = speed_tiers[speed_positive]
-
-                            # Add the benchmark values to the nature list
-                            ev_positive[evs] = {
-                                "jump": jump_stat,
-                                "stat": speed_positive,
-                                "speedties": speed_ties,
-                                "benchmark": benchmark,
-                            }
-
-                        # Update last positive
-                        last_positive = speed_positive
-
-                    # Calculate neutral nature speed stat
-                    speed_neutral = util.calculate_stat(
-                        base_speed,
-                        CONFIG.LEVEL,
-                        31,
-                        evs,
-                        CONFIG.NATURE_NEUTRAL,
-                    )
-
-                    # If the last stat was null, or new stat is higher
-                    if last_neutral == None or last_neutral < speed_neutral:
-                        # Get benchmark speed
-                        benchmark = speed_neutral - 1
-
-                        # If the speed stat below is in the tier list
-                        if benchmark in tiers:
-                            
-                            # Speed ties list
-                            speed_ties = []
-
-                            # Speed tying speed tier in list
-                            if speed_neutral in speed_tiers:
-                                speed_ties = speed_tiers[speed_neutral]
-
-                            # Add the benchmark values to the nature list
-                            ev_neutral[evs] = {
-                                "jump": False,  # Not possible for neutral natures
-                                "stat": speed_neutral,
-                                "speedties": speed_ties,
-                                "benchmark": speed_tiers[benchmark],
-                            }
-
-                        # Update last neutral
-                        last_neutral = speed_neutral
-
-                # Positive nature
-                iv_neutral = {}
-
-                # Neutral nature
-                iv_negative = {}
-
-                # Checks to see if evs change stats
-                # compared to previous (lower) number
-                last_neutral = None
-                last_negative = None
-
-                # Loop over iv ranges
-                for ivs in range(0, 32):
-                    # Calculate positive nature speed stat
-                    speed_neutral = util.calculate_stat(
-                        base_speed,
-                        CONFIG.LEVEL,
-                        ivs,
-                        0,
-                        CONFIG.NATURE_NEUTRAL,
-                    )
-
-                    # If the last stat was null, or new stat is higher
-                    if last_neutral == None or last_neutral < speed_neutral:
-                        # Get benchmark speed
-                        benchmark = speed_neutral - 1
-
-                        # If the speed stat below is in the tier list
-                        if benchmark in tiers:
-                            
-                            # Speed ties list
-                            speed_ties = []
-
-                            # Speed tying speed tier in list
-                            if speed_neutral in speed_tiers:
-                                speed_ties = speed_tiers[speed_neutral]
-
-                            # Add the benchmark values to the nature list
-                            iv_neutral[ivs] = {
-                                "jump": False,  # Not possible for neutral natures
-                                "stat": speed_neutral,
-                                "speedties": speed_ties,
-                                "benchmark": speed_tiers[benchmark],
-                            }
-
-                        # Update last positive
-                        last_neutral = speed_neutral
-
-                    # Calculate neutral nature speed stat
-                    speed_negative = util.calculate_stat(
-                        base_speed,
-                        CONFIG.LEVEL,
-                        ivs,
-                        0,
-                        CONFIG.NATURE_NEGATIVE,
-                    )
-
-                    # If the last stat was null, or new stat is higher
-                    if last_negative == None or last_negative < speed_negative:
-                        # Benchmarks reached
-                        benchmark = []
-
-                        # Check if the current stat is a jump stat
-                        jump_stat = is_jump_stat(last_negative, speed_negative)
-
-                        # Stat is a jump stat
-                        if jump_stat == True:
-                            # Get benchmark speed
-                            benchmark_speed = speed_negative - 2
-
-                            # Speed is in speed tiers list
-                            if benchmark_speed in tiers:
-                                # Add the benchmarks to the list
-                                benchmark += speed_tiers[benchmark_speed]
-
-                        # Get benchmark speed
-                        benchmark_speed = speed_positive - 1
-
-                        # Speed is in speed tiers list
-                        if benchmark_speed in tiers:
-                            # Add the benchmarks to the list
-                            benchmark += speed_tiers[benchmark_speed]
-
-                        # At least one benchmark reached
-                        if len(benchmark) > 0:
-
-                            # Speed ties list
-                            speed_ties = []
-
-                            # Speed tying speed tier in list
-                            if speed_negative in speed_tiers:
-                                speed_ties = speed_tiers[speed_negative]
-
-                            # Add the benchmark values to the nature list
-                            iv_negative[ivs] = {
-                                "jump": jump_stat,
-                                "stat": speed_negative,
-                                "speedties": speed_ties,
-                                "benchmark": benchmark,
-                            }
-
-                        # Update last negative
-                        last_negative = speed_negative
-
-                # Build the final report
-                report = {
-                    "species": species,
-                    "positive_ev": ev_positive,
-                    "neutral_ev": ev_neutral,
-                    "neutral_iv": iv_neutral,
-                    "negative_iv": iv_negative,
-                }
-
-                # Export species to json format
-                if CONFIG.SPECIES_JSON == True:
-                    # Generate a json string from the table
-                    output = JSON.dumps(
-                        report,
-                        sort_keys=CONFIG.JSON_SORT_KEYS,
-                        indent=CONFIG.JSON_INDENT,
-                    )
-
-                    # Generate json filename
-                    species_json = f"{name}.json"
-
-                    # Generate output json file full path
-                    json_path = os.path.join(CONFIG.OUTPUT_FOLDER, species_json)
-
-                    # Open the json report file path
-                    with open(json_path, "w+") as file:
-                        # Dump the report data to the file
-                        file.write(output)
-
-                # Export species to markdown format
-                if CONFIG.SPECIES_MD == True:
-                    content = [
-                        "| Spread | Stat | Jump | Benchmarks | Speed Ties |",
-                        "| ------ | ---- | ---- | ---------- | ---------- |",
-                    ]
-
-                    # Sort the positive evs from highest to lowest
-                    ev_pos_sorted = list(ev_positive.keys())
-                    ev_pos_sorted.sort(reverse=True)
-
-                    # Loop over the sorted evs
-                    for ev in ev_pos_sorted:
-                        # Get the data from the report
-                        ev_data = ev_positive[ev]
-                        stat = ev_data["stat"]
-                        jump = ev_data["jump"]
-
-                        # Build the benchmarks, speed ties string
-                        benchmark = ", ".join(ev_data["benchmark"])
-                        speed_ties = ", ".join(ev_data["speedties"])
-
-                        # Generate spread string
-                        spread_string = build_spread_string(
-                            31, ev, CONFIG.NATURE_POSITIVE
-                        )
-
-                        # Add row for spread to report
-                        content.append(
-                            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
-                        )
-
-                    # Sort the neutral evs from highest to lowest
-                    ev_neu_sorted = list(ev_neutral.keys())
-                    ev_neu_sorted.sort(reverse=True)
-
-                    # Loop over the sorted evs
-                    for ev in ev_neu_sorted:
-                        # Get the data from the report
-                        ev_data = ev_neutral[ev]
-                        stat = ev_data["stat"]
-                        jump = ev_data["jump"]
-
-                        # Build the benchmarks, speed ties string
-                        benchmark = ", ".join(ev_data["benchmark"])
-                        speed_ties = ", ".join(ev_data["speedties"])
-
-                        # Generate spread string
-                        spread_string = build_spread_string(
-                            31, ev, CONFIG.NATURE_NEUTRAL
-                        )
-
-                        # Add row for spread to report
-                        content.append(
-                            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
-                        )
-
-                    # Sort the neutral ivs from highest to lowest
-                    iv_neu_sorted = list(iv_neutral.keys())
-                    iv_neu_sorted.sort(reverse=True)
-
-                    # Loop over the sorted ivs
-                    for iv in iv_neu_sorted:
-                        # Get the data from the report
-                        iv_data = iv_neutral[iv]
-                        stat = iv_data["stat"]
-                        jump = iv_data["jump"]
-
-                        # Build the benchmarks, speed ties string
-                        benchmark = ", ".join(iv_data["benchmark"])
-                        speed_ties = ", ".join(iv_data["speedties"])
-
-                        # Generate spread string
-                        spread_string = build_spread_string(
-                            iv, 0, CONFIG.NATURE_NEUTRAL
-                        )
-
-                        # Add row for spread to report
-                        content.append(
-                            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
-                        )
-
-                    # Sort the neutral ivs from highest to lowest
-                    iv_neg_sorted = list(iv_negative.keys())
-                    iv_neg_sorted.sort(reverse=True)
-
-                    # Loop over the sorted ivs
-                    for iv in iv_neg_sorted:
-                        # Get the data from the report
-                        iv_data = iv_negative[iv]
-                        stat = iv_data["stat"]
-                        jump = iv_data["jump"]
-
-                        # Build the benchmarks, speed ties string
-                        benchmark = ", ".join(iv_data["benchmark"])
-                        speed_ties = ", ".join(iv_data["speedties"])
-
-                        # Generate spread string
-                        spread_string = build_spread_string(
-                            iv, 0, CONFIG.NATURE_NEGATIVE
-                        )
-
-                        # Add row for spread to report
-                        content.append(
-                            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
-                        )
-
-                    # Join the output contents
-                    output = "\n".join(content)
-
-                    # Generate md filename
-                    species_md = f"{name}.md"
-
-                    # Generate output md file full path
-                    md_path = os.path.join(CONFIG.OUTPUT_FOLDER, species_md)
-
-                    # Open the md report file path
-                    with open(md_path, "w+", encoding="utf8") as file:
-                        # Dump the report data to the file
-                        file.write(output)
+        # Species to generate reports for
+        species_list = []
+
+        # Loop over the arguments
+        for arg in args:
+            # If the arg is a valid species
+            if arg in POKEMON:
+                # Add the species data to the list
+                species_list.append(POKEMON[arg])
             else:
-                print(f"Failed for argument '{arg}': Unable to find matching species!")
+                log(f"Failed for argument '{arg}': Unable to find matching species!")
+
+        # SQLite output is enabled
+        sqlite_filename = getattr(CONFIG, "OUTPUT_SQLITE", None)
+        if sqlite_filename != None:
+            # Write the tiers, every species report to the database
+            with PROFILER.phase(f"write:{sqlite_filename}"):
+                PROFILER.count(
+                    "bytes_written",
+                    database.write_database(
+                        os.path.join(CONFIG.OUTPUT_FOLDER, sqlite_filename),
+                        POKEMON,
+                        speed_tiers,
+                        tier_index,
+                        species_list,
+                        CONFIG.LEVEL,
+                        ARGS.spreads,
+                    ),
+                )
+
+        # Cache is enabled
+        if cache_folder != None:
+            # Hash of every input to each species report
+            report_keys = {}
+            for species in species_list:
+                report_keys[species["name"]] = cache.hash_data(
+                    species,
+                    CONFIG.LEVEL,
+                    tiers_key,
+                    CONFIG.SPECIES_JSON,
+                    getattr(CONFIG, "SPECIES_JSON_COMPACT", False),
+                    CONFIG.SPECIES_MD,
+                    CONFIG.JSON_SORT_KEYS,
+                    CONFIG.JSON_INDENT,
+                    CONFIG.OUTPUT_FOLDER,
+                    ARGS.spreads,
+                )
+
+            # Only generate reports which have changed
+            species_list = cache.get_changed_reports(
+                species_list,
+                report_keys,
+                cache_folder,
+                lambda name: report.get_report_paths(name, CONFIG.OUTPUT_FOLDER),
+            )
+
+        # Loop over the generated species reports
+        with PROFILER.phase("reports"):
+            for result in report.generate_reports(
+                species_list,
+                tier_index,
+                CONFIG.LEVEL,
+                CONFIG.OUTPUT_FOLDER,
+                jobs=ARGS.jobs,
+                profiler=PROFILER,
+                full_search=ARGS.spreads,
+            ):
+                # Record the report counters
+                PROFILER.count("reports")
+                PROFILER.count("bytes_written", result["bytes"])
+
+                log(f"Processed species {result['name']} ...")
+
+        # Cache is enabled
+        if cache_folder != None:
+            # Save the report hashes
+            cache.save_report_keys(cache_folder, report_keys)
+    finally:
+        # Write the profile sidecar (including for the early exit modes)
+        PROFILER.stop()
+        PROFILER.write(CONFIG.OUTPUT_FOLDER)
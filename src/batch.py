@@ -0,0 +1,219 @@
+# Utility Functions
+import src.util as util
+
+# EV/IV Breakpoint Solver
+import src.solver as solver
+
+# Species Reports
+import src.report as report
+
+# Render Cache
+from src.render import RenderCache
+
+# Config Functions
+import config as CONFIG
+
+# JSON library
+import json as JSON
+
+# Process Pool
+from concurrent.futures import ProcessPoolExecutor
+
+# Double Ended Queue
+from collections import deque
+
+# OS Library
+import os
+
+# Results in flight for each worker
+BUFFER_PER_JOB = 4
+
+# Nature suffixes in spread strings (e.g. '31/252+')
+NATURE_SUFFIXES = {"+": util.NATURE_POSITIVE, "-": util.NATURE_NEGATIVE}
+
+# Supported nature multipliers
+NATURES = [util.NATURE_POSITIVE, util.NATURE_NEUTRAL, util.NATURE_NEGATIVE]
+
+
+def parse_spread(text):
+    # Nature suffix (neutral if not set)
+    nature = NATURE_SUFFIXES.get(text[-1:], util.NATURE_NEUTRAL)
+    text = text.rstrip("+-")
+
+    # Split the ivs / evs
+    ivs, evs = text.split("/")
+
+    # Return the spread
+    return {"ivs": int(ivs), "evs": int(evs), "nature": nature}
+
+
+def validate_spread(spread):
+    # Loop over the investment values, and their limits
+    for field, limit in [("ivs", solver.MAX_IVS), ("evs", solver.MAX_EVS)]:
+        # Investment is not a whole number
+        value = spread[field]
+        if type(value) != int:
+            raise TypeError(f"Invalid {field} '{value}', expected an integer")
+
+        # Investment is out of range
+        if value < 0 or value > limit:
+            raise ValueError(f"Invalid {field} '{value}', expected 0 to {limit}")
+
+    # Nature is not a supported multiplier
+    nature = spread["nature"]
+    if type(nature) not in [int, float] or nature not in NATURES:
+        raise ValueError(f"Invalid nature '{nature}', expected one of {NATURES}")
+
+    # Return the spread
+    return spread
+
+
+def parse_query(line, pokemon):
+    # Json query (e.g. {"species": "incineroar", "ivs": 31, "evs": 252, "nature": 1.1})
+    if line.startswith("{"):
+        data = JSON.loads(line)
+        key = data["species"]
+
+        # Species is not a species key
+        if not isinstance(key, str):
+            raise TypeError(f"Invalid species '{key}', expected a string")
+
+        # Spread override is set
+        spread = None
+        if "evs" in data or "ivs" in data or "nature" in data:
+            spread = {
+                "ivs": data.get("ivs", 31),
+                "evs": data.get("evs", 0),
+                "nature": data.get("nature", util.NATURE_NEUTRAL),
+            }
+    else:  # Text query (e.g. 'incineroar 31/252+')
+        parts = line.split()
+        key = parts[0]
+        spread = parse_spread(parts[1]) if len(parts) > 1 else None
+
+    # Species is not in the pokedex
+    if key not in pokemon:
+        raise ValueError(f"Unknown species '{key}'")
+
+    # Spread override is set, check the values
+    if spread != None:
+        validate_spread(spread)
+
+    # Return the query
+    return {"query": line, "species": pokemon[key], "spread": spread}
+
+
+def build_spread_result(species, spread, tier_index, level):
+    # Calculate the speed stat for the spread
+    stat = util.calculate_stat(
+        species["baseStats"]["spe"], level, spread["ivs"], spread["evs"], spread["nature"]
+    )
+
+    # Nearest tiers above, below the stat
+    above = tier_index.next_above(stat)
+    below = tier_index.next_below(stat)
+
+    # Return the spread result
+    return {
+        "spread": util.build_spread_string(spread["ivs"], spread["evs"], spread["nature"]),
+        "stat": stat,
+        "speedties": tier_index.get(stat, []),
+        "outspeeds": {"stat": below, "benchmark": tier_index.get(below, [])},
+        "outsped_by": {"stat": above, "benchmark": tier_index.get(above, [])},
+    }
+
+
+def run_query(query):
+    # Shared worker state
+    tier_index = report.WORKER_STATE["tier_index"]
+    level = report.WORKER_STATE["level"]
+
+    # Spread override, only report the spread
+    if query["spread"] != None:
+        result = build_spread_result(query["species"], query["spread"], tier_index, level)
+        result["species"] = query["species"]["name"]
+    else:  # Build the full species report
+        result = report.build_species_report(query["species"], tier_index, level)
+
+    # Encode the result as a single json line (reusing the
+    # benchmarks rendered for the worker's tier index)
+    return report.WORKER_STATE["ndjson_render"].encode(
+        {"query": query["query"], "result": result}
+    )
+
+
+def init_worker(speed_tiers, level):
+    # Build the speed tier index once per worker
+    report.init_worker(speed_tiers, level, None)
+
+    # Rendered benchmarks, shared by every query in the worker
+    report.WORKER_STATE["ndjson_render"] = RenderCache(CONFIG.JSON_SORT_KEYS)
+
+
+def iter_queries(lines, pokemon):
+    # Loop over the input lines
+    for line in lines:
+        # Skip blank lines
+        line = line.strip()
+        if line == "":
+            continue
+
+        try:
+            # Yield the parsed query
+            yield parse_query(line, pokemon)
+        except (ValueError, KeyError, TypeError) as e:
+            # Yield the error, so the output stays in input order
+            yield {"query": line, "error": str(e)}
+
+
+def encode_error(query):
+    # Encode the error as a single json line
+    return JSON.dumps({"query": query["query"], "error": query["error"]})
+
+
+def generate_results(queries, tier_index, level, jobs=1):
+    # Single job, process in the current process
+    if jobs == 1:
+        # Share the existing index with the in-process worker
+        report.WORKER_STATE["tier_index"] = tier_index
+        report.WORKER_STATE["level"] = level
+
+        # Rendered benchmarks, replaced along with the index
+        report.WORKER_STATE["ndjson_render"] = RenderCache(CONFIG.JSON_SORT_KEYS)
+
+        # Loop over the queries
+        for query in queries:
+            yield encode_error(query) if "error" in query else run_query(query)
+
+        return
+
+    # Zero (or fewer) jobs, use all of the available cpus
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+
+    # Results in input order (futures, or encoded errors)
+    pending = deque()
+
+    # Speed tiers are sent to each worker once, via the initializer
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_worker,
+        initargs=(tier_index.speed_tiers, level),
+    ) as executor:
+        # Loop over the queries
+        for query in queries:
+            # Query is invalid, or submit the query to the pool
+            if "error" in query:
+                pending.append(encode_error(query))
+            else:
+                pending.append(executor.submit(run_query, query))
+
+            # Buffer is full, wait for the oldest result
+            while len(pending) >= jobs * BUFFER_PER_JOB:
+                result = pending.popleft()
+                yield result if isinstance(result, str) else result.result()
+
+        # Yield the remaining results
+        while len(pending) > 0:
+            result = pending.popleft()
+            yield result if isinstance(result, str) else result.result()
@@ -0,0 +1,228 @@
+# Speed Tier Engines
+import src.engine as engine
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# JSON library
+import json as JSON
+
+# Tier Records
+from src.records import TierRecords
+
+# Hash Library
+import hashlib
+
+# OS Library
+import os
+
+# Cache format version, increment
+# to invalidate existing caches
+CACHE_VERSION = 3
+
+# Cache filenames
+TIERS_CACHE = "tiers.json"
+REPORTS_CACHE = "reports.json"
+
+
+def hash_data(*values):
+    # Serialise the values in a stable format
+    content = JSON.dumps(values, sort_keys=True, separators=(",", ":"))
+
+    # Return the content hash
+    return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+
+def load_cache(cache_folder, filename):
+    # Build the path to the cache file
+    cache_path = os.path.join(cache_folder, filename)
+
+    # Cache file does not exist
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        # Open the cache file
+        with open(cache_path, "r", encoding="utf8") as file:
+            # Read json data from file
+            cache = JSON.load(file)
+    except (OSError, ValueError):
+        # Unreadable cache, start over
+        return {}
+
+    # Cache was written by a different version
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+
+    # Return the cache data
+    return cache
+
+
+def save_cache(cache_folder, filename, cache):
+    # Ensure the cache directory exists
+    os.makedirs(cache_folder, exist_ok=True)
+
+    # Set the cache version
+    cache["version"] = CACHE_VERSION
+
+    # Build the path to the cache file
+    cache_path = os.path.join(cache_folder, filename)
+
+    # Write to a temporary file, then swap it in
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w+", encoding="utf8") as file:
+        JSON.dump(cache, file, separators=(",", ":"))
+    os.replace(temp_path, cache_path)
+
+
+def write_if_changed(path, content, encoding="utf8"):
+    # File already exists
+    if os.path.exists(path):
+        # Open the existing file
+        with open(path, "r", encoding=encoding) as file:
+            # Content is identical, skip the write
+            if file.read() == content:
+                return 0
+
+    # Open the file and write the content
+    with open(path, "w+", encoding=encoding) as file:
+        file.write(content)
+
+    # Return the number of bytes written
+    return os.path.getsize(path)
+
+
+def build_speed_tiers_cached(
+    pokemon,
+    level,
+    combinations,
+    stages,
+    include_species=None,
+    exclude_species=None,
+    cache_folder="cache",
+    engine_name=engine.ENGINE_PYTHON,
+):
+    # Load the existing cache
+    cache = load_cache(cache_folder, TIERS_CACHE)
+    cached_stats = cache.get("stats", {})
+
+    # Included species keys
+    keys = engine.filter_species(pokemon, include_species, exclude_species)
+
+    # Species names, base speeds (in record order)
+    names = [pokemon[key]["name"] for key in keys]
+    base_speeds = [pokemon[key]["baseStats"]["spe"] for key in keys]
+
+    # Stage / modifier set keys, for hashing
+    stage_keys = modifiers.get_stage_keys(stages)
+
+    # Hash of every input to the table
+    tiers_key = hash_data(names, base_speeds, level, combinations, stage_keys)
+
+    # Column keys, for each combination / stage (in record order)
+    columns = [
+        (combination_index, stage_index, hash_data(level, combination, stage_key))
+        for combination_index, combination in enumerate(combinations)
+        for stage_index, stage_key in enumerate(stage_keys)
+    ]
+
+    # Staged stats used by this run (column key -> base speed -> stat)
+    stats = {column_key: {} for _, _, column_key in columns}
+
+    # Base speeds, combinations, stages with missing stats
+    missing_bases = set()
+    missing_combinations = set()
+    missing_stages = set()
+
+    # Loop over the distinct base speeds
+    for base_speed in set(base_speeds):
+        # Loop over the columns
+        for combination_index, stage_index, column_key in columns:
+            # Stat is in the cache
+            stat = cached_stats.get(column_key, {}).get(str(base_speed))
+            if stat != None:
+                stats[column_key][str(base_speed)] = stat
+            else:  # Stat has changed, or is new
+                missing_bases.add(base_speed)
+                missing_combinations.add(combination_index)
+                missing_stages.add(stage_index)
+
+    # Some stats are missing
+    if len(missing_bases) > 0:
+        # Missing combinations, stages (in order)
+        missing_combinations = sorted(missing_combinations)
+        missing_stages = sorted(missing_stages)
+
+        # Calculate the missing stats with the selected engine
+        missing_stats = engine.build_base_stats(
+            missing_bases,
+            level,
+            [combinations[index] for index in missing_combinations],
+            [stages[index] for index in missing_stages],
+            engine=engine_name,
+        )
+
+        # Column keys, for each missing combination / stage (in result order)
+        missing_columns = [
+            columns[combination_index * len(stages) + stage_index][2]
+            for combination_index in missing_combinations
+            for stage_index in missing_stages
+        ]
+
+        # Loop over the calculated base speeds
+        for base_speed, base_stats in missing_stats.items():
+            # Add the stats to the columns
+            for column_key, stat in zip(missing_columns, base_stats):
+                stats[column_key][str(base_speed)] = stat
+
+    # Staged stats for each distinct base speed, in record order
+    base_stats = {
+        base_speed: [stats[column_key][str(base_speed)] for _, _, column_key in columns]
+        for base_speed in set(base_speeds)
+    }
+
+    # Build the speed tiers table from the staged stats
+    speed_tiers = engine.add_base_records(
+        TierRecords(names, combinations, stages), base_speeds, base_stats
+    )
+
+    # Update the cache (stale stats are dropped)
+    save_cache(cache_folder, TIERS_CACHE, {"stats": stats})
+
+    # Return the speed tiers
+    return speed_tiers, tiers_key
+
+
+def get_changed_reports(species_list, report_keys, cache_folder, get_paths):
+    # Load the existing report hashes
+    cached_reports = load_cache(cache_folder, REPORTS_CACHE).get("reports", {})
+
+    # Species with changed reports
+    changed = []
+
+    # Loop over the species
+    for species in species_list:
+        # Dereference species name
+        name = species["name"]
+
+        # Report inputs have changed
+        if cached_reports.get(name) != report_keys[name]:
+            changed.append(species)
+
+        # Report files have been removed
+        elif not all(os.path.exists(path) for path in get_paths(name)):
+            changed.append(species)
+
+    # Return the changed species
+    return changed
+
+
+def save_report_keys(cache_folder, report_keys):
+    # Load the existing report hashes
+    cache = load_cache(cache_folder, REPORTS_CACHE)
+
+    # Update the report hashes
+    cache["reports"] = {**cache.get("reports", {}), **report_keys}
+
+    # Save the report hashes
+    save_cache(cache_folder, REPORTS_CACHE, cache)
@@ -0,0 +1,219 @@
+# Species Reports
+import src.report as report
+
+# JSON library
+import json as JSON
+
+# SQLite Library
+import sqlite3
+
+# Regular Expressions
+import re
+
+# OS Library
+import os
+
+# Database schema version (stored in 'user_version')
+SCHEMA_VERSION = 1
+
+# Benchmark string, e.g. '+1 Scarf 31/252+ Kangaskhan-Mega'
+BENCHMARK_PATTERN = re.compile(r"^(.*?)(\d+/\d+[+-]?) (.*)$")
+
+# Tables (dropped and rebuilt on every write, in the insert transaction)
+SCHEMA = """
+DROP TABLE IF EXISTS report_rows;
+DROP TABLE IF EXISTS tiers;
+DROP TABLE IF EXISTS benchmarks;
+DROP TABLE IF EXISTS species;
+
+CREATE TABLE species (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    num INTEGER,
+    base_speed INTEGER NOT NULL
+);
+
+CREATE TABLE benchmarks (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    species_id INTEGER REFERENCES species (id),
+    modifiers TEXT NOT NULL,
+    spread TEXT
+);
+
+CREATE TABLE tiers (
+    stat INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    benchmark_id INTEGER NOT NULL REFERENCES benchmarks (id),
+    PRIMARY KEY (stat, position)
+) WITHOUT ROWID;
+
+CREATE TABLE report_rows (
+    species_id INTEGER NOT NULL REFERENCES species (id),
+    section TEXT NOT NULL,
+    investment INTEGER NOT NULL,
+    stat INTEGER NOT NULL,
+    jump INTEGER NOT NULL,
+    benchmark_low INTEGER NOT NULL,
+    benchmark_high INTEGER NOT NULL,
+    spreads TEXT,
+    PRIMARY KEY (species_id, section, investment)
+) WITHOUT ROWID;
+"""
+
+# Indexes (created after the bulk inserts)
+INDEXES = """
+CREATE UNIQUE INDEX species_key ON species (key);
+CREATE INDEX species_name ON species (name);
+CREATE UNIQUE INDEX benchmarks_label ON benchmarks (label);
+CREATE INDEX benchmarks_species ON benchmarks (species_id);
+CREATE INDEX tiers_benchmark ON tiers (benchmark_id);
+CREATE INDEX report_rows_stat ON report_rows (stat);
+"""
+
+
+def parse_benchmark(benchmark):
+    # Split the modifiers, spread and species name
+    match = BENCHMARK_PATTERN.match(benchmark)
+
+    # Not a spread benchmark
+    if match == None:
+        return "", None, None
+
+    # Return the modifiers, spread, species name
+    return match.group(1), match.group(2), match.group(3)
+
+
+def write_database(
+    path, pokemon, speed_tiers, tier_index, species_list, level, full_search=False
+):
+    # Open the database
+    connection = sqlite3.connect(path)
+
+    try:
+        # Write everything in a single transaction, so the
+        # previous tables are kept if any statement fails
+        with connection:
+            # Start the transaction before the schema statements
+            # (which do not start one implicitly)
+            connection.execute("BEGIN")
+
+            # Rebuild the tables
+            for statement in SCHEMA.strip().split(";"):
+                if statement.strip() != "":
+                    connection.execute(statement)
+
+            # Species rows, ids by name
+            species_rows = []
+            species_ids = {}
+
+            # Loop over the species in the pokedex
+            for species_id, key in enumerate(pokemon, start=1):
+                # Dereference values
+                pokemon_data = pokemon[key]
+                name = pokemon_data["name"]
+
+                # Add the species row
+                species_rows.append(
+                    (
+                        species_id,
+                        key,
+                        name,
+                        pokemon_data.get("num"),
+                        pokemon_data["baseStats"]["spe"],
+                    )
+                )
+                species_ids.setdefault(name, species_id)
+
+            connection.executemany(
+                "INSERT INTO species VALUES (?, ?, ?, ?, ?)", species_rows
+            )
+
+            # Benchmark rows, ids by label
+            benchmark_rows = []
+            benchmark_ids = {}
+
+            # Tier rows
+            tier_rows = []
+
+            # Loop over the tiers
+            for stat in sorted(speed_tiers.keys()):
+                # Loop over the benchmarks for the tier
+                for position, benchmark in enumerate(speed_tiers[stat]):
+                    # Benchmark has not been added yet
+                    if benchmark not in benchmark_ids:
+                        # Split the benchmark string
+                        modifiers, spread, name = parse_benchmark(benchmark)
+
+                        # Add the benchmark row
+                        benchmark_ids[benchmark] = len(benchmark_rows) + 1
+                        benchmark_rows.append(
+                            (
+                                benchmark_ids[benchmark],
+                                benchmark,
+                                species_ids.get(name),
+                                modifiers.strip(),
+                                spread,
+                            )
+                        )
+
+                    # Add the tier row
+                    tier_rows.append((stat, position, benchmark_ids[benchmark]))
+
+            connection.executemany(
+                "INSERT INTO benchmarks VALUES (?, ?, ?, ?, ?)", benchmark_rows
+            )
+            connection.executemany("INSERT INTO tiers VALUES (?, ?, ?)", tier_rows)
+
+            # Report rows
+            report_rows = []
+
+            # Loop over the species
+            for species in species_list:
+                # Build the species report
+                species_report = report.build_species_report(
+                    species, tier_index, level, full_search
+                )
+                species_id = species_ids[species["name"]]
+
+                # Loop over the report sections
+                for section, rows in species_report.items():
+                    # Not a report section
+                    if section == "species":
+                        continue
+
+                    # Loop over the section rows
+                    for investment, data in rows.items():
+                        # Stat range of the benchmarks (see SpeedTierIndex.benchmarks)
+                        low, high = data["benchmark"].key
+
+                        # Add the report row
+                        report_rows.append(
+                            (
+                                species_id,
+                                section,
+                                investment,
+                                data["stat"],
+                                data["jump"],
+                                low,
+                                high,
+                                JSON.dumps(data["spreads"]) if "spreads" in data else None,
+                            )
+                        )
+
+            connection.executemany(
+                "INSERT INTO report_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?)", report_rows
+            )
+
+            # Create the indexes, and set the schema version
+            for statement in INDEXES.strip().split(";"):
+                if statement.strip() != "":
+                    connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    finally:
+        # Close the database
+        connection.close()
+
+    # Return the database size
+    return os.path.getsize(path)
@@ -0,0 +1,175 @@
+# Speed Tier Engines
+import src.engine as engine
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# Binary Tier Files
+import src.tierfile as tierfile
+
+# JSON library
+import json as JSON
+
+# Module Loading
+import importlib.util
+
+# OS Library
+import os
+
+
+def load_config(path):
+    # Load the config module from the file
+    spec = importlib.util.spec_from_file_location("diff_config", path)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+
+    # Return the config module
+    return config
+
+
+def build_config_tiers(pokemon, config, engine_name):
+    # Build the speed tiers for the config
+    return engine.build_speed_tiers(
+        pokemon,
+        config.LEVEL,
+        config.STAT_COMBINATIONS,
+        modifiers.get_stages(config),
+        config.INCLUDE_SPECIES,
+        config.EXCLUDE_SPECIES,
+        engine=engine_name,
+    )
+
+
+def load_tiers(path, pokemon, config, engine_name=engine.ENGINE_PYTHON):
+    # Get the file extension
+    _, extension = os.path.splitext(path)
+
+    # Binary tier file
+    if extension == ".bin":
+        return tierfile.TierFile(path)
+
+    # Config file, build the tiers with the current pokedex
+    if extension == ".py":
+        return build_config_tiers(pokemon, load_config(path), engine_name)
+
+    # Open the json file
+    with open(path, "r", encoding="utf8") as file:
+        data = JSON.load(file)
+
+    # Speed tiers table (e.g. tiers.json)
+    if all(key.isdigit() for key in data):
+        return {int(stat): benchmarks for stat, benchmarks in data.items()}
+
+    # Pokedex file, build the tiers with the current config
+    return build_config_tiers(data, config, engine_name)
+
+
+def diff_tiers(old_tiers, new_tiers):
+    # Sorted stats for each table
+    old_stats = sorted(old_tiers.keys())
+    new_stats = sorted(new_tiers.keys())
+
+    # Benchmarks only in the old / new tables (benchmark -> stat)
+    removed = {}
+    added = {}
+
+    # Stats whose benchmarks changed
+    changed = []
+
+    # Merge-join the sorted stats
+    i, j = 0, 0
+    while i < len(old_stats) or j < len(new_stats):
+        # Next stat from either table
+        old_stat = old_stats[i] if i < len(old_stats) else None
+        new_stat = new_stats[j] if j < len(new_stats) else None
+
+        # Stat is only in the old table
+        if new_stat == None or (old_stat != None and old_stat < new_stat):
+            stat = old_stat
+            old_benchmarks = old_tiers[stat]
+            new_benchmarks = []
+            i += 1
+        # Stat is only in the new table
+        elif old_stat == None or new_stat < old_stat:
+            stat = new_stat
+            old_benchmarks = []
+            new_benchmarks = new_tiers[stat]
+            j += 1
+        else:  # Stat is in both tables
+            stat = old_stat
+            old_benchmarks = old_tiers[stat]
+            new_benchmarks = new_tiers[stat]
+            i += 1
+            j += 1
+
+        # Tier is unchanged
+        if old_benchmarks == new_benchmarks:
+            continue
+
+        # Add the stat to the changed tiers
+        changed.append(stat)
+
+        # Benchmarks in the old / new tier
+        old_set = set(old_benchmarks)
+        new_set = set(new_benchmarks)
+
+        # Benchmarks which left the tier
+        for benchmark in old_benchmarks:
+            if benchmark not in new_set:
+                removed[benchmark] = stat
+
+        # Benchmarks which joined the tier
+        for benchmark in new_benchmarks:
+            if benchmark not in old_set:
+                added[benchmark] = stat
+
+    # Benchmarks which left one tier and joined another
+    moved = []
+    for benchmark in [benchmark for benchmark in removed if benchmark in added]:
+        moved.append(
+            {
+                "benchmark": benchmark,
+                "from": removed.pop(benchmark),
+                "to": added.pop(benchmark),
+            }
+        )
+
+    # Return the tier changes
+    return {
+        "added": [
+            {"benchmark": benchmark, "stat": stat} for benchmark, stat in added.items()
+        ],
+        "removed": [
+            {"benchmark": benchmark, "stat": stat} for benchmark, stat in removed.items()
+        ],
+        "moved": moved,
+        "tiers": changed,
+    }
+
+
+def write_diff_json(diff, file, sort_keys=True, indent=None):
+    # Write the tier changes to the file
+    JSON.dump(diff, file, sort_keys=sort_keys, indent=indent)
+
+
+def write_diff_markdown(diff, file):
+    # Write the summary
+    file.write(
+        f"{len(diff['tiers'])} tiers changed: {len(diff['added'])} added, "
+        f"{len(diff['removed'])} removed, {len(diff['moved'])} moved"
+    )
+
+    # Write the moved benchmarks table
+    file.write("\n\n| Moved | From | To |\n| ----- | ---- | -- |")
+    for move in diff["moved"]:
+        file.write(f"\n| {move['benchmark']} | {move['from']} | {move['to']} |")
+
+    # Write the added benchmarks table
+    file.write("\n\n| Added | Speed |\n| ----- | ----- |")
+    for entry in diff["added"]:
+        file.write(f"\n| {entry['benchmark']} | {entry['stat']} |")
+
+    # Write the removed benchmarks table
+    file.write("\n\n| Removed | Speed |\n| ------- | ----- |")
+    for entry in diff["removed"]:
+        file.write(f"\n| {entry['benchmark']} | {entry['stat']} |")
@@ -0,0 +1,372 @@
+# Utility Functions
+import src.util as util
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# Species Filters
+import src.filters as filters
+
+# Tier Records
+from src.records import TierRecords, RECORD_TYPE
+
+# Typed Arrays
+from array import array
+
+# NumPy is optional, and only
+# required for the numpy engine
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Supported tier engines
+ENGINE_PYTHON = "python"
+ENGINE_NUMPY = "numpy"
+ENGINES = [ENGINE_PYTHON, ENGINE_NUMPY]
+
+
+def filter_species(pokemon, include_species=None, exclude_species=None):
+    # Filter the species with the (cached) index for the dex
+    return filters.get_species_index(pokemon).filter(include_species, exclude_species)
+
+
+def calculate_base_stats(base_speed, level, combinations, modifier_sets):
+    # Staged stats, in record order
+    stats = []
+
+    # Loop over all of the stat combinations
+    for combination in combinations:
+        # Calculate the speed stat for the combination
+        speed_stat = util.calculate_stat(
+            base_speed,
+            level,
+            combination["ivs"],
+            combination["evs"],
+            combination["nature"],
+        )
+
+        # Apply the stages / modifiers to the stat
+        stats += [modifier_set.apply(speed_stat) for modifier_set in modifier_sets]
+
+    # Return the staged stats
+    return stats
+
+
+def add_base_records(speed_tiers, base_speeds, base_stats):
+    # Speed stat -> record codes
+    records = speed_tiers.records
+
+    # Loop over all of the included Pokemon
+    for species_index, base_speed in enumerate(base_speeds):
+        # Record code for the first combination / stage
+        code = speed_tiers.encode(species_index, 0, 0)
+
+        # Loop over the staged stats for the base speed
+        for stage_stat in base_stats[base_speed]:
+            # If the stat is in the tiers
+            if stage_stat in records:
+                # Add the record to the speed tier
+                records[stage_stat].append(code)
+            else:
+                # Create a new entry with the speed tier
+                records[stage_stat] = array(RECORD_TYPE, [code])
+
+            # Record code for the next combination / stage
+            code += 1
+
+    # Return the speed tiers
+    return speed_tiers
+
+
+def build_speed_tiers_python(
+    pokemon, level, combinations, stages, include_species=None, exclude_species=None
+):
+    # Included species keys
+    keys = filter_species(pokemon, include_species, exclude_species)
+
+    # This table will be indexed with the following:
+    # key: Speed Number (e.g. 167)
+    # value: Records of the Pokemon which reach this stat (with conditions),
+    # which are formatted on access (e.g. 252+ Mega Kangaskhan)
+    speed_tiers = TierRecords([pokemon[key]["name"] for key in keys], combinations, stages)
+
+    # Base speed of each species
+    base_speeds = [pokemon[key]["baseStats"]["spe"] for key in keys]
+
+    # Staged stats for each distinct base speed, in record order
+    # (combination, then stage), shared by every species with the base
+    base_stats = build_base_stats(set(base_speeds), level, combinations, stages)
+
+    # Add the records for each species to the speed tiers
+    return add_base_records(speed_tiers, base_speeds, base_stats)
+
+
+def build_base_stats(base_speeds, level, combinations, stages, engine=ENGINE_PYTHON):
+    # Distinct base speeds, in a stable order
+    base_speeds = sorted(set(base_speeds))
+
+    # NumPy engine selected
+    if engine == ENGINE_NUMPY:
+        # NumPy is not installed
+        if np == None:
+            raise ImportError("The numpy engine requires numpy to be installed!")
+
+        # Nothing to calculate
+        if len(base_speeds) == 0 or len(combinations) == 0 or len(stages) == 0:
+            return {base_speed: [] for base_speed in base_speeds}
+
+        # Evaluate the stat formula, apply the stages once per base
+        stats = calculate_base_stats_numpy(
+            np.array(base_speeds, dtype=np.int64), level, combinations
+        )
+        staged = apply_stages_numpy(stats, stages).reshape(len(base_speeds), -1)
+
+        # Return the staged stats for each base, in record order
+        return dict(zip(base_speeds, staged.tolist()))
+
+    # Python engine selected
+    if engine == ENGINE_PYTHON:
+        # Stage / modifier sets for each stage
+        modifier_sets = [modifiers.as_modifier_set(stage) for stage in stages]
+
+        # Return the staged stats for each base, in record order
+        return {
+            base_speed: calculate_base_stats(base_speed, level, combinations, modifier_sets)
+            for base_speed in base_speeds
+        }
+
+    # Unknown engine
+    raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}!")
+
+
+def build_speed_tiers_numpy(
+    pokemon, level, combinations, stages, include_species=None, exclude_species=None
+):
+    # NumPy is not installed
+    if np == None:
+        raise ImportError("The numpy engine requires numpy to be installed!")
+
+    # Included species keys
+    keys = filter_species(pokemon, include_species, exclude_species)
+
+    # Speed tiers table
+    speed_tiers = TierRecords([pokemon[key]["name"] for key in keys], combinations, stages)
+
+    # Nothing to calculate
+    if len(keys) == 0 or len(combinations) == 0 or len(stages) == 0:
+        return speed_tiers
+
+    # Evaluate the stat formula for every species / combination
+    stats = calculate_stats_numpy(pokemon, keys, level, combinations)
+
+    # Add the staged stats to the speed tiers
+    add_records_numpy(speed_tiers, apply_stages_numpy(stats, stages))
+
+    # Return the speed tiers
+    return speed_tiers
+
+
+def calculate_stats_numpy(pokemon, keys, level, combinations):
+    # Distinct base speeds, and the base of each species
+    base, inverse = np.unique(
+        np.array([pokemon[key]["baseStats"]["spe"] for key in keys], dtype=np.int64),
+        return_inverse=True,
+    )
+
+    # Evaluate the stat formula once per base, and fan
+    # the stats out to the species (shape: species x combinations)
+    return calculate_base_stats_numpy(base, level, combinations)[inverse.reshape(-1)]
+
+
+def calculate_base_stats_numpy(base, level, combinations):
+    # Base speeds (shape: bases x 1)
+    base = base[:, None]
+
+    # Combination values (shape: 1 x combinations)
+    ivs = np.array([c["ivs"] for c in combinations], dtype=np.int64)[None, :]
+    evs = np.array([c["evs"] for c in combinations], dtype=np.int64)[None, :]
+    natures = np.array([c["nature"] for c in combinations], dtype=np.float64)[None, :]
+
+    # Evaluate the stat formula once per base (shape: bases x combinations)
+    raw = ((2 * base + ivs + (evs // 4)) * level) // 100 + 5
+
+    # Apply the natures
+    return np.floor(raw * natures)
+
+
+def apply_stages_numpy(stats, stages):
+    # Stage / modifier sets for each stage
+    modifier_sets = [modifiers.as_modifier_set(stage) for stage in stages]
+
+    # Distinct unmodified stats
+    stats = stats.astype(np.int64)
+    values = np.unique(stats)
+
+    # Modified stat table (shape: stages x distinct stats), where
+    # each modifier is calculated once per distinct stat
+    table = np.array(
+        [[m.apply(value) for value in values.tolist()] for m in modifier_sets],
+        dtype=np.int64,
+    ).reshape(len(modifier_sets), len(values))
+
+    # Look up the modified stats (shape: species x combinations x stages)
+    positions = np.searchsorted(values, stats)
+    return np.moveaxis(table[:, positions], 0, -1)
+
+
+def add_records_numpy(speed_tiers, staged):
+    # Flatten in the same order as the python engine, so
+    # the flat position of each stat is its record code
+    flat = staged.ravel()
+
+    # Stable sort, so each tier keeps the order entries were generated in
+    order = np.argsort(flat, kind="stable")
+    tiers, starts = np.unique(flat[order], return_index=True)
+    ends = [*starts[1:].tolist(), len(order)]
+
+    # Insert tiers in order of first appearance (same as python engine)
+    first = order[starts]
+    groups = sorted(zip(first.tolist(), tiers.tolist(), starts.tolist(), ends))
+
+    # Record codes, in the record array format
+    codes = order.astype(np.uintc)
+
+    # Loop over the grouped tiers
+    for _, tier, start, end in groups:
+        # Copy the record codes for this tier
+        records = array(RECORD_TYPE)
+        records.frombytes(codes[start:end].tobytes())
+        speed_tiers.records[tier] = records
+
+
+def build_speed_tiers_matrix(
+    pokemon,
+    levels,
+    combinations,
+    stage_sets,
+    include_species=None,
+    exclude_species=None,
+    engine=ENGINE_PYTHON,
+):
+    # Included species keys, names (shared by every cell)
+    keys = filter_species(pokemon, include_species, exclude_species)
+    names = [pokemon[key]["name"] for key in keys]
+
+    # Speed tiers table for each (level, stage set name) cell
+    matrix = {
+        (level, name): TierRecords(names, combinations, stages)
+        for level in levels
+        for name, stages in stage_sets.items()
+    }
+
+    # Stage / modifier sets for each of the stage sets
+    stage_sets = {
+        name: [modifiers.as_modifier_set(stage) for stage in stages]
+        for name, stages in stage_sets.items()
+    }
+
+    # Distinct stages across all of the stage sets
+    all_stages = list(
+        dict.fromkeys(stage for stages in stage_sets.values() for stage in stages)
+    )
+
+    # Nothing to calculate
+    if len(keys) == 0 or len(combinations) == 0 or len(all_stages) == 0:
+        return matrix
+
+    # NumPy engine selected
+    if engine == ENGINE_NUMPY:
+        # NumPy is not installed
+        if np == None:
+            raise ImportError("The numpy engine requires numpy to be installed!")
+
+        # Loop over the levels
+        for level in levels:
+            # Evaluate the stat formula once per level
+            stats = calculate_stats_numpy(pokemon, keys, level, combinations)
+
+            # Apply every distinct stage once per level
+            staged = apply_stages_numpy(stats, all_stages)
+
+            # Loop over the stage sets
+            for name, stages in stage_sets.items():
+                # Select the stages for the cell
+                columns = [all_stages.index(stage) for stage in stages]
+
+                # Add the staged stats to the cell
+                add_records_numpy(matrix[(level, name)], staged[:, :, columns])
+
+        # Return the speed tiers matrix
+        return matrix
+
+    # Staged stats for each distinct base speed / level, for each
+    # combination, shared by every species with the base
+    base_stats = {}
+
+    # Loop over all of the included Pokemon
+    for species_index, key in enumerate(keys):
+        # Dereference values
+        base_speed = pokemon[key]["baseStats"]["spe"]
+
+        # Loop over the levels
+        for level in levels:
+            # Base speed has not been calculated for the level yet
+            if (base_speed, level) not in base_stats:
+                # Apply each distinct stage to the stat for each combination once
+                base_stats[(base_speed, level)] = [
+                    {
+                        stage: stage_stat
+                        for stage, stage_stat in zip(
+                            all_stages,
+                            calculate_base_stats(base_speed, level, [combination], all_stages),
+                        )
+                    }
+                    for combination in combinations
+                ]
+
+            # Loop over all of the stat combinations
+            for combination_index, staged in enumerate(base_stats[(base_speed, level)]):
+                # Loop over the stage sets
+                for name, stages in stage_sets.items():
+                    # Speed tiers table for the cell
+                    speed_tiers = matrix[(level, name)]
+
+                    # Record code for the first stage
+                    code = speed_tiers.encode(species_index, combination_index, 0)
+
+                    # Loop over the stages
+                    for stage in stages:
+                        # Add the record to the speed tiers
+                        speed_tiers.add(staged[stage], code)
+
+                        # Record code for the next stage
+                        code += 1
+
+    # Return the speed tiers matrix
+    return matrix
+
+
+def build_speed_tiers(
+    pokemon,
+    level,
+    combinations,
+    stages,
+    include_species=None,
+    exclude_species=None,
+    engine=ENGINE_PYTHON,
+):
+    # NumPy engine selected
+    if engine == ENGINE_NUMPY:
+        return build_speed_tiers_numpy(
+            pokemon, level, combinations, stages, include_species, exclude_species
+        )
+
+    # Python engine selected
+    if engine == ENGINE_PYTHON:
+        return build_speed_tiers_python(
+            pokemon, level, combinations, stages, include_species, exclude_species
+        )
+
+    # Unknown engine
+    raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}!")
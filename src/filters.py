@@ -0,0 +1,163 @@
+# JSON library
+import json as JSON
+
+# Bisect Library
+import bisect
+
+# Last dex number in each generation (used when a species has no 'gen')
+GENERATION_ENDS = [151, 251, 386, 493, 649, 721, 809, 905, 1025]
+
+# Generation for formes introduced after their base species
+# (same as the Showdown dex), checked in order
+FORME_GENERATIONS = [
+    (9, lambda forme: "Paldea" in forme),
+    (8, lambda forme: forme in ["Gmax", "Galar", "Galar-Zen", "Hisui"]),
+    (7, lambda forme: forme.startswith("Alola") or forme == "Starter"),
+    (6, lambda forme: forme in ["Primal", "Mega", "Mega-X", "Mega-Y"]),
+]
+
+# Pokedex fields which can be filtered on
+FILTER_FIELDS = ["num", "forme", "isNonstandard", "tags", "gen"]
+
+
+def get_generation(pokemon_data):
+    # Generation is set in the pokedex
+    if "gen" in pokemon_data:
+        return pokemon_data["gen"]
+
+    # No dex number (e.g. CAP, Pokestar), no generation
+    num = pokemon_data["num"]
+    if num < 1:
+        return 0
+
+    # Generation from the dex number
+    generation = min(bisect.bisect_left(GENERATION_ENDS, num) + 1, len(GENERATION_ENDS))
+
+    # Generation from the forme, for formes added later
+    forme = pokemon_data.get("forme", "")
+    for forme_generation, matches in FORME_GENERATIONS:
+        if matches(forme):
+            return max(generation, forme_generation)
+
+    # Return the generation
+    return generation
+
+
+def get_field_values(pokemon_data, field):
+    # Tags (a species can have more than one)
+    if field == "tags":
+        return pokemon_data.get("tags", [])
+
+    # Generation
+    if field == "gen":
+        return [get_generation(pokemon_data)]
+
+    # Single value field (None if not set, e.g. standard / base forme)
+    return [pokemon_data.get(field)]
+
+
+def normalise_rules(rules):
+    # Rules are disabled
+    if rules == None:
+        return None
+
+    # List of dex numbers (e.g. [*range(1, 1026)])
+    if not isinstance(rules, dict):
+        return {"num": rules}
+
+    # Field rules
+    return rules
+
+
+class SpeciesIndex:
+    def __init__(self, pokemon):
+        # Species keys, in dex order
+        self.keys = list(pokemon.keys())
+
+        # Every species
+        self.all = (1 << len(self.keys)) - 1
+
+        # Field -> value -> bitmap of species positions
+        self.bitmaps = {field: {} for field in FILTER_FIELDS}
+
+        # Loop over the species
+        for position, key in enumerate(self.keys):
+            # Species bit
+            bit = 1 << position
+
+            # Loop over the fields
+            for field, bitmaps in self.bitmaps.items():
+                # Add the species to the bitmap for each value
+                for value in get_field_values(pokemon[key], field):
+                    bitmaps[value] = bitmaps.get(value, 0) | bit
+
+        # Compiled rules (rules -> bitmap)
+        self.compiled = {}
+
+    def compile(self, rules):
+        # Hashable key for the rules
+        key = JSON.dumps(rules, sort_keys=True, default=list)
+
+        # Rules have not been compiled yet
+        if key not in self.compiled:
+            # Start with every species
+            bitmap = self.all
+
+            # Loop over the field rules (species must match every field)
+            for field, values in rules.items():
+                # Field can not be filtered on
+                if field not in self.bitmaps:
+                    raise ValueError(
+                        f"Unknown species filter field '{field}', expected one of {FILTER_FIELDS}!"
+                    )
+
+                # Single value for the field
+                if not isinstance(values, (list, tuple, set, range)):
+                    values = [values]
+
+                # Species matching any of the values
+                matches = 0
+                for value in values:
+                    matches |= self.bitmaps[field].get(value, 0)
+
+                # Species must also match this field
+                bitmap &= matches
+
+            self.compiled[key] = bitmap
+
+        # Return the compiled bitmap
+        return self.compiled[key]
+
+    def filter(self, include_species=None, exclude_species=None):
+        # Normalise the rules
+        include_species = normalise_rules(include_species)
+        exclude_species = normalise_rules(exclude_species)
+
+        # Included species (every species if not set)
+        bitmap = self.all
+        if include_species != None:
+            bitmap &= self.compile(include_species)
+
+        # Excluded species
+        if exclude_species != None:
+            bitmap &= ~self.compile(exclude_species)
+
+        # Species positions, lowest first
+        bits = bin(bitmap)[:1:-1]
+
+        # Return the filtered species keys
+        return [self.keys[position] for position, bit in enumerate(bits) if bit == "1"]
+
+
+# Species index for each loaded dex
+INDEXES = {}
+
+
+def get_species_index(pokemon):
+    # Dex has not been indexed yet (the dex is kept
+    # alongside its index, so the id is not reused)
+    if id(pokemon) not in INDEXES or INDEXES[id(pokemon)][0] is not pokemon:
+        INDEXES[id(pokemon)] = (pokemon, SpeciesIndex(pokemon))
+
+    # Return the species index
+    return INDEXES[id(pokemon)][1]
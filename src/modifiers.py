@@ -0,0 +1,174 @@
+# Utility Functions
+import src.util as util
+
+# Iteration Tools
+import itertools
+
+# Fixed point modifier base (as used by the games)
+MODIFIER_BASE = 4096
+
+# Known speed modifiers
+# group: Only one modifier per group can be active at once
+# multiplier: Chained (fixed point) speed multiplier
+# final: Percentage applied after the chained multipliers
+MODIFIERS = {
+    "scarf": {"label": "Scarf", "group": "item", "multiplier": 1.5},
+    "ironball": {"label": "Iron Ball", "group": "item", "multiplier": 0.5},
+    "tailwind": {"label": "Tailwind", "group": "field", "multiplier": 2},
+    "swiftswim": {"label": "Swift Swim", "group": "ability", "multiplier": 2},
+    "chlorophyll": {"label": "Chlorophyll", "group": "ability", "multiplier": 2},
+    "sandrush": {"label": "Sand Rush", "group": "ability", "multiplier": 2},
+    "slushrush": {"label": "Slush Rush", "group": "ability", "multiplier": 2},
+    "surgesurfer": {"label": "Surge Surfer", "group": "ability", "multiplier": 2},
+    "unburden": {"label": "Unburden", "group": "ability", "multiplier": 2},
+    "paralysis": {"label": "Paralysis", "group": "status", "final": 50},
+}
+
+
+def chain_multipliers(multipliers):
+    # Start with a neutral modifier
+    modifier = MODIFIER_BASE
+
+    # Loop over the multipliers
+    for multiplier in multipliers:
+        # Convert the multiplier to fixed point
+        numerator = int(multiplier * MODIFIER_BASE)
+
+        # Chain the multiplier with the previous modifier
+        modifier = (modifier * numerator + 2048) >> 12
+
+    # Return the chained modifier
+    return modifier
+
+
+def apply_chain(stat, modifier):
+    # Neutral modifier
+    if modifier == MODIFIER_BASE:
+        return stat
+
+    # Apply the modifier (rounding half down)
+    return (stat * modifier + 2047) // MODIFIER_BASE
+
+
+class ModifierSet:
+    __slots__ = ["stage", "modifiers", "chain", "finals", "prefix", "key", "table"]
+
+    def __init__(self, stage=0, modifiers=()):
+        # Groups which already have a modifier
+        groups = set()
+
+        # Loop over the modifiers
+        for modifier in modifiers:
+            # Modifier is not known
+            if modifier not in MODIFIERS:
+                raise ValueError(f"Unknown speed modifier '{modifier}'!")
+
+            # Modifier group already has a modifier
+            group = MODIFIERS[modifier]["group"]
+            if group in groups:
+                raise ValueError(f"Only one '{group}' speed modifier can be applied!")
+            groups.add(group)
+
+        # Stat stage, speed modifiers
+        self.stage = stage
+        self.modifiers = tuple(modifiers)
+
+        # Chained multipliers, final percentages
+        self.chain = chain_multipliers(
+            MODIFIERS[m]["multiplier"] for m in self.modifiers if "multiplier" in MODIFIERS[m]
+        )
+        self.finals = [MODIFIERS[m]["final"] for m in self.modifiers if "final" in MODIFIERS[m]]
+
+        # Benchmark string prefix (e.g. '+1 Scarf ')
+        labels = "".join(f"{MODIFIERS[m]['label']} " for m in self.modifiers)
+        self.prefix = util.build_stage_string(stage, labels)
+
+        # Hashable key for the set
+        self.key = (stage, self.modifiers)
+
+        # Modified stats, computed once per distinct stat
+        self.table = {}
+
+    def calculate(self, stat):
+        # Apply the stat stage
+        stat = util.apply_stage(stat, self.stage)
+
+        # Apply the chained multipliers
+        stat = apply_chain(stat, self.chain)
+
+        # Apply the final percentages
+        for percent in self.finals:
+            stat = stat * percent // 100
+
+        # Return the modified stat
+        return stat
+
+    def apply(self, stat):
+        # Stat has not been modified yet
+        if stat not in self.table:
+            self.table[stat] = self.calculate(stat)
+
+        # Return the modified stat
+        return self.table[stat]
+
+    def __eq__(self, other):
+        return isinstance(other, ModifierSet) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"ModifierSet(stage={self.stage}, modifiers={list(self.modifiers)})"
+
+
+def as_modifier_set(stage):
+    # Already a modifier set
+    if isinstance(stage, ModifierSet):
+        return stage
+
+    # Modifier set definition, e.g. {"stage": 1, "modifiers": ["scarf"]}
+    if isinstance(stage, dict):
+        return ModifierSet(stage.get("stage", 0), stage.get("modifiers", ()))
+
+    # Stat stage only
+    return ModifierSet(stage)
+
+
+def get_stage_keys(stages):
+    # Hashable (json serialisable) keys for the stages
+    return [as_modifier_set(stage).key for stage in stages]
+
+
+def enumerate_modifier_sets(options, max_active=None):
+    # Stat stage options
+    stage_options = options.get("stage", [0])
+
+    # Modifier options for each of the other groups
+    groups = [values for group, values in options.items() if group != "stage"]
+
+    # Lazily loop over every combination of the options
+    for stage, *values in itertools.product(stage_options, *groups):
+        # Active modifiers (None is no modifier for the group)
+        active = [value for value in values if value != None]
+
+        # Too many active modifiers (including the stage)
+        if max_active != None and len(active) + (stage != 0) > max_active:
+            continue
+
+        # Yield the modifier set
+        yield ModifierSet(stage, active)
+
+
+def get_stages(config):
+    # Speed modifier options
+    options = getattr(config, "MODIFIERS", None)
+
+    # No modifier options, use the configured stages
+    if options == None:
+        return config.STAGES
+
+    # Maximum number of active modifiers
+    max_active = getattr(config, "MAX_ACTIVE_MODIFIERS", None)
+
+    # Enumerate the requested modifier sets
+    return list(enumerate_modifier_sets(options, max_active))
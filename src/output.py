@@ -0,0 +1,123 @@
+# JSON library
+import json as JSON
+
+# File Comparison Library
+import filecmp
+
+# OS Library
+import os
+
+# Output file buffer size
+BUFFER_SIZE = 1024 * 1024
+
+
+def write_tiers_json(speed_tiers, file, sort_keys=True, indent=None):
+    # Get the tiers in output order
+    if sort_keys == True:
+        stats = sorted(speed_tiers.keys())
+    else:
+        stats = list(speed_tiers.keys())
+
+    # Empty table
+    if len(stats) == 0:
+        file.write("{}")
+        return
+
+    # Compact output (same separators as json.dumps)
+    if indent == None:
+        newline = ""
+        indent = ""
+        separator = ", "
+    else:  # Indented output
+        # Integer indent is a number of spaces
+        if isinstance(indent, int):
+            indent = " " * indent
+
+        newline = "\n"
+        separator = ","
+
+    # Item prefixes for the table, tier levels
+    tier_prefix = f"{newline}{indent}"
+    item_prefix = f"{newline}{indent}{indent}"
+
+    # Start the table
+    file.write("{")
+
+    # Loop over the tiers
+    for i, stat in enumerate(stats):
+        # Separate from the previous tier
+        if i > 0:
+            file.write(separator)
+
+        # Get the benchmarks for the tier
+        tier_data = speed_tiers[stat]
+
+        # Write the tier key
+        file.write(f'{tier_prefix}"{stat}": ')
+
+        # Empty tier
+        if len(tier_data) == 0:
+            file.write("[]")
+            continue
+
+        # Encode the tier benchmarks
+        items = f"{separator}{item_prefix}".join(JSON.dumps(item) for item in tier_data)
+
+        # Write the tier benchmarks
+        file.write(f"[{item_prefix}{items}{tier_prefix}]")
+
+    # End the table
+    file.write(f"{newline}}}")
+
+
+def write_tiers_markdown(speed_tiers, stats, file):
+    # Write the table header
+    file.write("| Speed | Amount | Benchmarks |\n| ----- | ------ | ---------- |")
+
+    # Loop over the sorted stats
+    for stat in stats:
+        # Get the data for the speed tier
+        tier_data = speed_tiers[stat]
+
+        # Get the number of benchmarks in the tier
+        tier_count = len(tier_data)
+
+        # Join the tier benchmarks array
+        benchmarks = ", ".join(tier_data)
+
+        # Write the speed tier row
+        file.write(f"\n| {stat} | {tier_count} | {benchmarks} |")
+
+
+def get_cell_filename(filename, level, name):
+    # Output is disabled
+    if filename == None:
+        return None
+
+    # Insert the level, stage set name before the extension
+    root, extension = os.path.splitext(filename)
+    return f"{root}-{level}-{name}{extension}"
+
+
+def write_output(path, writer, encoding="utf8"):
+    # Write to a temporary file first
+    temp_path = f"{path}.tmp"
+
+    # No encoding, open the file in binary mode
+    mode = "w+" if encoding != None else "wb+"
+
+    # Open the temporary file with a large write buffer
+    with open(temp_path, mode, encoding=encoding, buffering=BUFFER_SIZE) as file:
+        # Stream the output to the file
+        writer(file)
+
+    # Content is identical to the existing file, skip the write
+    if os.path.exists(path) and filecmp.cmp(temp_path, path, shallow=False):
+        os.remove(temp_path)
+        return 0
+
+    # Swap in the new file
+    os.replace(temp_path, path)
+
+    # Return the number of bytes written
+    return os.path.getsize(path)
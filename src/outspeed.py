@@ -0,0 +1,175 @@
+# Speed Tier Engines
+import src.engine as engine
+
+# Utility Functions
+import src.util as util
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# JSON library
+import json as JSON
+
+# OS Library
+import os
+
+# NumPy is optional, and only
+# required for the outspeed matrix
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Outspeed matrix file format version
+MATRIX_VERSION = 1
+
+# Default number of rows compared per chunk
+CHUNK_ROWS = 256
+
+# Comparison results
+FASTER = 1
+TIE = 0
+SLOWER = -1
+
+
+def get_metadata_path(path):
+    # Metadata is stored next to the matrix file
+    root, _ = os.path.splitext(path)
+    return f"{root}.json"
+
+
+def build_speed_vector(pokemon, keys, level, combinations, stages):
+    # Evaluate the stat formula for every species / combination
+    stats = engine.calculate_stats_numpy(pokemon, keys, level, combinations)
+
+    # Apply the stages (shape: species x combinations x stages), and flatten
+    # so each species has one contiguous block of spreads
+    return engine.apply_stages_numpy(stats, stages).reshape(-1).astype(np.int32)
+
+
+def write_outspeed_matrix(path, speeds, chunk_rows=CHUNK_ROWS):
+    # Create the on-disk matrix (rows x columns)
+    matrix = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.int8, shape=(len(speeds), len(speeds))
+    )
+
+    # Column speeds (shape: 1 x columns)
+    columns = speeds[None, :]
+
+    # Loop over the row chunks
+    for start in range(0, len(speeds), chunk_rows):
+        # Row speeds for the chunk (shape: chunk x 1)
+        rows = speeds[start : start + chunk_rows, None]
+
+        # Compare the chunk against every column
+        matrix[start : start + len(rows)] = np.sign(rows - columns)
+
+    # Flush the matrix to disk
+    matrix.flush()
+    del matrix
+
+
+def build_outspeed_matrix(
+    pokemon,
+    level,
+    combinations,
+    stages,
+    path,
+    include_species=None,
+    exclude_species=None,
+    chunk_rows=CHUNK_ROWS,
+):
+    # NumPy is not installed
+    if np == None:
+        raise ImportError("The outspeed matrix requires numpy to be installed!")
+
+    # Included species keys
+    keys = engine.filter_species(pokemon, include_species, exclude_species)
+
+    # Nothing to compare
+    if len(keys) == 0 or len(combinations) == 0 or len(stages) == 0:
+        raise ValueError("The outspeed matrix requires at least one spread!")
+
+    # Speed of each spread for each species
+    speeds = build_speed_vector(pokemon, keys, level, combinations, stages)
+
+    # Write the comparisons to disk in chunks
+    write_outspeed_matrix(path, speeds, chunk_rows)
+
+    # Spread strings for each combination / stage (in the same order as the matrix)
+    spreads = [
+        f"{modifiers.as_modifier_set(stage).prefix}{util.build_spread_string(c['ivs'], c['evs'], c['nature'])}"
+        for c in combinations
+        for stage in stages
+    ]
+
+    # Open the metadata file
+    with open(get_metadata_path(path), "w+") as file:
+        # Write the metadata to the file
+        JSON.dump(
+            {
+                "version": MATRIX_VERSION,
+                "level": level,
+                "keys": keys,
+                "names": [pokemon[key]["name"] for key in keys],
+                "spreads": spreads,
+            },
+            file,
+        )
+
+    # Return the matrix reader
+    return OutspeedMatrix(path)
+
+
+class OutspeedMatrix:
+    def __init__(self, path):
+        # NumPy is not installed
+        if np == None:
+            raise ImportError("The outspeed matrix requires numpy to be installed!")
+
+        # Open the metadata file
+        with open(get_metadata_path(path), "r") as file:
+            metadata = JSON.load(file)
+
+        # Metadata is from a different version
+        if metadata.get("version") != MATRIX_VERSION:
+            raise ValueError(f"Unsupported outspeed matrix version in '{path}'!")
+
+        # Matrix level, species keys / names, spreads
+        self.level = metadata["level"]
+        self.keys = metadata["keys"]
+        self.names = metadata["names"]
+        self.spreads = metadata["spreads"]
+
+        # Species index, by key and by name
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.index.update({name: i for i, name in enumerate(self.names)})
+
+        # Memory-mapped comparisons (read only)
+        self.data = np.load(path, mmap_mode="r")
+
+    def get_species_slice(self, species):
+        # Species is not in the matrix
+        if species not in self.index:
+            raise KeyError(f"Species '{species}' is not in the outspeed matrix!")
+
+        # Block of spreads for the species
+        start = self.index[species] * len(self.spreads)
+        return slice(start, start + len(self.spreads))
+
+    def row(self, species):
+        # Species spreads compared to every spread (shape: spreads x all spreads)
+        return self.data[self.get_species_slice(species)]
+
+    def column(self, species):
+        # Every spread compared to the species spreads (shape: all spreads x spreads)
+        return self.data[:, self.get_species_slice(species)]
+
+    def compare(self, species, other):
+        # Species spreads compared to the other species spreads (shape: spreads x spreads)
+        return self.data[self.get_species_slice(species), self.get_species_slice(other)]
+
+    def outspeeds(self, species):
+        # Species names which the species outspeeds with every spread
+        faster = (self.row(species) == FASTER).reshape(len(self.spreads), len(self.names), -1)
+        return [self.names[i] for i in np.flatnonzero(faster.all(axis=(0, 2)))]
@@ -0,0 +1,108 @@
+# JSON library
+import json as JSON
+
+# Timing, Memory Libraries
+import time, tracemalloc
+
+# Context Managers
+from contextlib import contextmanager
+
+# OS Library
+import os
+
+# Profile sidecar filename
+PROFILE_FILENAME = "profile.json"
+
+
+class Profiler:
+    def __init__(self, enabled=False):
+        # Profiling is enabled
+        self.enabled = enabled
+
+        # Recorded phases, counters
+        self.phases = []
+        self.counters = {}
+
+        # Currently running phases
+        self.stack = []
+
+    def start(self):
+        # Start tracing memory allocations
+        if self.enabled == True and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        # Stop tracing memory allocations
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name):
+        # Profiling is disabled
+        if self.enabled == False:
+            yield
+            return
+
+        # Save the peak memory of the parent phase, and reset the peak
+        if len(self.stack) > 0:
+            parent = self.stack[-1]
+            parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+        # Phase timings
+        current = {
+            "name": name,
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+            "peak": 0,
+        }
+        self.stack.append(current)
+
+        try:
+            yield
+        finally:
+            # Calculate the phase timings, peak memory
+            self.stack.pop()
+            peak = max(current["peak"], tracemalloc.get_traced_memory()[1])
+
+            # Add the peak memory to the parent phase
+            if len(self.stack) > 0:
+                self.stack[-1]["peak"] = max(self.stack[-1]["peak"], peak)
+
+            # Record the phase
+            self.record(
+                name,
+                time.perf_counter() - current["wall"],
+                time.process_time() - current["cpu"],
+                peak,
+            )
+
+    def record(self, name, wall, cpu, peak=None):
+        # Profiling is disabled
+        if self.enabled == False:
+            return
+
+        # Add the phase to the list
+        self.phases.append({"name": name, "wall": wall, "cpu": cpu, "peak_memory": peak})
+
+    def count(self, name, amount=1):
+        # Increment the counter
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def write(self, output_folder, filename=PROFILE_FILENAME):
+        # Profiling is disabled
+        if self.enabled == False:
+            return
+
+        # Ensure the output directory exists
+        os.makedirs(output_folder, exist_ok=True)
+
+        # Build the path to the profile file
+        profile_path = os.path.join(output_folder, filename)
+
+        # Open the profile file
+        with open(profile_path, "w+") as file:
+            # Write the profile data to the file
+            JSON.dump(
+                {"phases": self.phases, "counters": self.counters}, file, indent=2
+            )
@@ -0,0 +1,85 @@
+# Utility Functions
+import src.util as util
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# Typed Arrays
+from array import array
+
+from collections.abc import Mapping
+
+# Record array type code (unsigned int)
+RECORD_TYPE = "I"
+
+
+class TierRecords(Mapping):
+    __slots__ = ["names", "spreads", "prefixes", "records"]
+
+    def __init__(self, names, combinations, stages, records=None):
+        # Species name suffixes (per species)
+        self.names = [f" {name}" if name else "" for name in names]
+
+        # Spread strings (per combination)
+        self.spreads = [
+            util.build_spread_string(c["ivs"], c["evs"], c["nature"])
+            for c in combinations
+        ]
+
+        # Stage / modifier prefixes (per stage)
+        self.prefixes = [modifiers.as_modifier_set(stage).prefix for stage in stages]
+
+        # Speed stat -> record codes, where each code is
+        # (species index * combinations + combination index) * stages + stage index
+        self.records = {} if records == None else records
+
+    def encode(self, species_index, combination_index, stage_index):
+        # Pack the indices into a single record code
+        return (
+            species_index * len(self.spreads) + combination_index
+        ) * len(self.prefixes) + stage_index
+
+    def decode(self, code):
+        # Unpack the record code into its indices
+        code, stage_index = divmod(code, len(self.prefixes))
+        species_index, combination_index = divmod(code, len(self.spreads))
+
+        # Return the species, combination, stage indices
+        return species_index, combination_index, stage_index
+
+    def add(self, stat, code):
+        # If the stat is in the tiers
+        if stat in self.records:
+            # Add the record to the speed tier
+            self.records[stat].append(code)
+        else:
+            # Create a new entry with the speed tier
+            self.records[stat] = array(RECORD_TYPE, [code])
+
+    def format(self, code):
+        # Get the record indices
+        species_index, combination_index, stage_index = self.decode(code)
+
+        # Build the benchmark string
+        return f"{self.prefixes[stage_index]}{self.spreads[combination_index]}{self.names[species_index]}"
+
+    def count(self, stat):
+        # Number of benchmarks in the tier
+        return len(self.records[stat])
+
+    def __getitem__(self, stat):
+        # Format the benchmark strings for the tier
+        return [self.format(code) for code in self.records[stat]]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, stat):
+        return stat in self.records
+
+    def to_dict(self):
+        # Format every tier into a plain speed tiers table
+        return {stat: self[stat] for stat in self.records}
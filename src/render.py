@@ -0,0 +1,138 @@
+# Speed Tier Index
+from src.tiers import BenchmarkList
+
+# JSON library
+import json as JSON
+
+# JSON string encoder (same as json.dumps)
+from json.encoder import encode_basestring_ascii as encode_string
+
+
+class SharedSection(dict):
+    __slots__ = ["key"]
+
+    def __init__(self, key, items=()):
+        super().__init__(items)
+
+        # Report section key (name, base speed, level), used as the render cache key
+        self.key = key
+
+
+class RenderCache:
+    def __init__(self, sort_keys=True, indent=None):
+        # Json output settings
+        self.sort_keys = sort_keys
+        self.indent = " " * indent if isinstance(indent, int) else indent
+
+        # Rendered strings, by benchmark stat range / section key
+        self.joined = {}
+        self.encoded = {}
+
+        # Rendered documents, by report section keys
+        self.documents = {}
+
+    def join(self, benchmarks):
+        # Not a shared benchmark list, render it directly
+        if not isinstance(benchmarks, BenchmarkList):
+            return ", ".join(benchmarks)
+
+        # Benchmarks have not been joined yet
+        if benchmarks.key not in self.joined:
+            self.joined[benchmarks.key] = ", ".join(benchmarks)
+
+        # Return the joined benchmarks
+        return self.joined[benchmarks.key]
+
+    def encode_value(self, value, depth):
+        # Encode the value (same output as json.dumps)
+        encoded = JSON.dumps(value, sort_keys=self.sort_keys, indent=self.indent)
+
+        # Indent the nested lines for the depth
+        if self.indent != None and depth > 0:
+            encoded = encoded.replace("\n", "\n" + self.indent * depth)
+
+        # Return the encoded value
+        return encoded
+
+    def encode_items(self, pairs, depth, start, end):
+        # Empty list / object
+        if len(pairs) == 0:
+            return f"{start}{end}"
+
+        # Compact output (same separators as json.dumps)
+        if self.indent == None:
+            return f"{start}{', '.join(pairs)}{end}"
+
+        # Indented output
+        item_prefix = "\n" + self.indent * (depth + 1)
+        end_prefix = "\n" + self.indent * depth
+
+        # Return the encoded items
+        return f"{start}{item_prefix}{(',' + item_prefix).join(pairs)}{end_prefix}{end}"
+
+    def encode(self, value, depth=0):
+        # Strings, integers and constants
+        if isinstance(value, str):
+            return encode_string(value)
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if value is None:
+            return "null"
+        if type(value) == int:
+            return int.__repr__(value)
+
+        # Shared benchmark list / report section
+        if isinstance(value, (BenchmarkList, SharedSection)):
+            # Value has not been encoded at this depth yet
+            key = (value.key, depth)
+            if key not in self.encoded:
+                self.encoded[key] = self.encode_container(value, depth)
+
+            # Return the encoded value
+            return self.encoded[key]
+
+        # Lists, objects
+        if isinstance(value, (list, dict)):
+            return self.encode_container(value, depth)
+
+        # Other values are encoded by the json library
+        return self.encode_value(value, depth)
+
+    def encode_container(self, value, depth):
+        # Lists
+        if isinstance(value, list):
+            return self.encode_items(
+                [self.encode(item, depth + 1) for item in value], depth, "[", "]"
+            )
+
+        # Get the items in output order
+        items = sorted(value.items()) if self.sort_keys == True else value.items()
+
+        # Encode the key, value pairs
+        pairs = [
+            f"{encode_string(str(key))}: {self.encode(item, depth + 1)}"
+            for key, item in items
+        ]
+
+        # Return the encoded object
+        return self.encode_items(pairs, depth, "{", "}")
+
+    def render_document(self, report, builder):
+        # Keys of the shared sections in the report
+        keys = tuple(
+            value.key for value in report.values() if isinstance(value, SharedSection)
+        )
+
+        # No shared sections, render the report directly
+        if len(keys) == 0:
+            return builder(report, self)
+
+        # Document has not been rendered yet (the builder must
+        # only use the shared sections of the report)
+        if keys not in self.documents:
+            self.documents[keys] = builder(report, self)
+
+        # Return the rendered document
+        return self.documents[keys]
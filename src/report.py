@@ -0,0 +1,586 @@
+# Utility Functions
+import src.util as util
+
+# EV/IV Breakpoint Solver
+import src.solver as solver
+
+# Speed Tier Index
+from src.tiers import SpeedTierIndex
+
+# Output Cache
+import src.cache as cache
+
+# Render Cache
+from src.render import RenderCache, SharedSection
+
+# Config Functions
+import config as CONFIG
+
+# Process Pool
+from concurrent.futures import ProcessPoolExecutor
+
+# Timing, Memory Libraries
+import time, tracemalloc
+
+# OS Library
+import os
+
+# Compact report schema version (see compact_species_report)
+REPORT_SCHEMA_COMPACT = 2
+
+
+# Check if the current stat is a jump stat
+def is_jump_stat(last_value, current_value):
+    # Return true if the last value was not none, and difference between
+    # the last value and the current value (regardless of signedness) is
+    # greater than one (i.e. 2+ stat jumps between values)
+    return last_value != None and abs(last_value - current_value) > 1
+
+
+def build_report_section(breakpoints, tier_index):
+    # Report section (investment -> benchmark data)
+    section = {}
+
+    # Previous (lower) stat
+    last_stat = None
+
+    # Loop over the investment breakpoints
+    for investment, stat in breakpoints:
+        # Check if the current stat is a jump stat
+        jump_stat = is_jump_stat(last_stat, stat)
+
+        # First breakpoint, only the stat below is outsped
+        if last_stat == None:
+            benchmark = tier_index.benchmarks(stat - 1, stat - 1)
+        else:  # Previous stat (and any jumped stats) are outsped
+            benchmark = tier_index.benchmarks(last_stat, stat - 1)
+
+        # At least one benchmark reached
+        if len(benchmark) > 0:
+            # Add the benchmark values to the section
+            section[investment] = {
+                "jump": jump_stat,
+                "stat": stat,
+                "speedties": tier_index.benchmarks(stat, stat),
+                "benchmark": benchmark,
+            }
+
+        # Update last stat
+        last_stat = stat
+
+    # Return the report section
+    return section
+
+
+def build_spread_section(base_speed, level, nature, tier_index):
+    # Minimal points breakpoints for the nature
+    breakpoints = solver.spread_breakpoints(base_speed, level, nature)
+
+    # Build the report section (points -> benchmark data)
+    section = build_report_section(breakpoints, tier_index)
+
+    # Loop over the reported points
+    for points, data in section.items():
+        # Add every undominated spread which spends the points
+        data["spreads"] = [
+            util.build_spread_string(ivs, evs, nature)
+            for ivs, evs in solver.get_points_spreads(points)
+        ]
+
+    # Return the report section
+    return section
+
+
+def build_base_sections(base_speed, tier_index, level, full_search=False):
+    # Evs (with 31 ivs) for positive, neutral natures
+    ev_positive = build_report_section(
+        solver.ev_breakpoints(base_speed, level, CONFIG.NATURE_POSITIVE), tier_index
+    )
+    ev_neutral = build_report_section(
+        solver.ev_breakpoints(base_speed, level, CONFIG.NATURE_NEUTRAL), tier_index
+    )
+
+    # Ivs (with 0 evs) for neutral, negative natures
+    iv_neutral = build_report_section(
+        solver.iv_breakpoints(base_speed, level, CONFIG.NATURE_NEUTRAL), tier_index
+    )
+    iv_negative = build_report_section(
+        solver.iv_breakpoints(base_speed, level, CONFIG.NATURE_NEGATIVE), tier_index
+    )
+
+    # Build the report sections
+    sections = {
+        "positive_ev": ev_positive,
+        "neutral_ev": ev_neutral,
+        "neutral_iv": iv_neutral,
+        "negative_iv": iv_negative,
+    }
+
+    # Full ivs x evs x nature search
+    if full_search == True:
+        # Minimal spreads (mixing ivs, evs) for each nature
+        sections["positive_spread"] = build_spread_section(
+            base_speed, level, CONFIG.NATURE_POSITIVE, tier_index
+        )
+        sections["neutral_spread"] = build_spread_section(
+            base_speed, level, CONFIG.NATURE_NEUTRAL, tier_index
+        )
+        sections["negative_spread"] = build_spread_section(
+            base_speed, level, CONFIG.NATURE_NEGATIVE, tier_index
+        )
+
+    # Return the report sections, shared by every species with the base
+    return {
+        name: SharedSection((name, base_speed, level), section)
+        for name, section in sections.items()
+    }
+
+
+def build_species_report(species, tier_index, level, full_search=False):
+    # Get the base stats for the species
+    base_stats = species["baseStats"]
+    base_speed = base_stats["spe"]
+
+    # Sections only depend on the base speed, so they are
+    # built once and shared by every species with the base
+    key = (base_speed, level, full_search)
+    if key not in tier_index.sections:
+        tier_index.sections[key] = build_base_sections(
+            base_speed, tier_index, level, full_search
+        )
+
+    # Build the final report
+    return {"species": species, **tier_index.sections[key]}
+
+
+def compact_section(section):
+    # Compact report section (investment -> benchmark data)
+    compact = SharedSection(section.key + ("compact",))
+
+    # Loop over the section rows
+    for investment, data in section.items():
+        # Benchmarks, speed ties are referenced by stat, instead of
+        # copied (the speed ties are the tier for the row stat)
+        compact[investment] = {
+            "jump": data["jump"],
+            "stat": data["stat"],
+            "benchmark": list(data["benchmark"].key),
+        }
+
+        # Full search section
+        if "spreads" in data:
+            compact[investment]["spreads"] = data["spreads"]
+
+    # Return the compact section
+    return compact
+
+
+def compact_species_report(report, tier_index=None):
+    # Compact sections, shared by every species with the base
+    memo = tier_index.compact if tier_index != None else {}
+
+    # Compact report, tagged with the schema version
+    compact = {"schema": REPORT_SCHEMA_COMPACT}
+
+    # Loop over the report values
+    for name, value in report.items():
+        # Report section, compact it once per base speed
+        if isinstance(value, SharedSection):
+            if value.key not in memo:
+                memo[value.key] = compact_section(value)
+            compact[name] = memo[value.key]
+        else:  # Species data
+            compact[name] = value
+
+    # Return the compact report
+    return compact
+
+
+def expand_species_report(report, speed_tiers):
+    # Not a compact report, nothing to expand
+    if report.get("schema") != REPORT_SCHEMA_COMPACT:
+        return report
+
+    # Speed tiers table (stat -> benchmarks), or an existing index
+    if isinstance(speed_tiers, SpeedTierIndex):
+        tier_index = speed_tiers
+    else:
+        tier_index = SpeedTierIndex(speed_tiers)
+
+    # Expanded report
+    expanded = {}
+
+    # Loop over the report values
+    for name, value in report.items():
+        # Schema version is only set for compact reports
+        if name == "schema":
+            continue
+
+        # Species data
+        if name == "species":
+            expanded[name] = value
+            continue
+
+        # Expanded section (investment -> benchmark data)
+        section = {}
+        for investment, data in value.items():
+            # Stat range of the benchmarks, inclusive
+            low, high = data["benchmark"]
+            stat = data["stat"]
+
+            # Copy the benchmarks, speed ties from the tiers
+            section[investment] = {
+                "jump": data["jump"],
+                "stat": stat,
+                "speedties": list(tier_index.benchmarks(stat, stat)),
+                "benchmark": list(tier_index.benchmarks(low, high)),
+            }
+
+            # Full search section
+            if "spreads" in data:
+                section[investment]["spreads"] = data["spreads"]
+
+        expanded[name] = section
+
+    # Return the expanded report
+    return expanded
+
+
+def build_species_markdown(report, render=None):
+    # No shared render cache, render this report on its own
+    if render == None:
+        render = RenderCache()
+
+    # Markdown only uses the report sections, so it is
+    # rendered once for every species with the same sections
+    return render.render_document(report, build_sections_markdown)
+
+
+def build_sections_markdown(report, render):
+    # Dereference the report sections
+    ev_positive = report["positive_ev"]
+    ev_neutral = report["neutral_ev"]
+    iv_neutral = report["neutral_iv"]
+    iv_negative = report["negative_iv"]
+
+    content = [
+        "| Spread | Stat | Jump | Benchmarks | Speed Ties |",
+        "| ------ | ---- | ---- | ---------- | ---------- |",
+    ]
+
+    # Sort the positive evs from highest to lowest
+    ev_pos_sorted = list(ev_positive.keys())
+    ev_pos_sorted.sort(reverse=True)
+
+    # Loop over the sorted evs
+    for ev in ev_pos_sorted:
+        # Get the data from the report
+        ev_data = ev_positive[ev]
+        stat = ev_data["stat"]
+        jump = ev_data["jump"]
+
+        # Build the benchmarks, speed ties string
+        benchmark = render.join(ev_data["benchmark"])
+        speed_ties = render.join(ev_data["speedties"])
+
+        # Generate spread string
+        spread_string = util.build_spread_string(
+            31, ev, CONFIG.NATURE_POSITIVE
+        )
+
+        # Add row for spread to report
+        content.append(
+            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
+        )
+
+    # Sort the neutral evs from highest to lowest
+    ev_neu_sorted = list(ev_neutral.keys())
+    ev_neu_sorted.sort(reverse=True)
+
+    # Loop over the sorted evs
+    for ev in ev_neu_sorted:
+        # Get the data from the report
+        ev_data = ev_neutral[ev]
+        stat = ev_data["stat"]
+        jump = ev_data["jump"]
+
+        # Build the benchmarks, speed ties string
+        benchmark = render.join(ev_data["benchmark"])
+        speed_ties = render.join(ev_data["speedties"])
+
+        # Generate spread string
+        spread_string = util.build_spread_string(
+            31, ev, CONFIG.NATURE_NEUTRAL
+        )
+
+        # Add row for spread to report
+        content.append(
+            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
+        )
+
+    # Sort the neutral ivs from highest to lowest
+    iv_neu_sorted = list(iv_neutral.keys())
+    iv_neu_sorted.sort(reverse=True)
+
+    # Loop over the sorted ivs
+    for iv in iv_neu_sorted:
+        # Get the data from the report
+        iv_data = iv_neutral[iv]
+        stat = iv_data["stat"]
+        jump = iv_data["jump"]
+
+        # Build the benchmarks, speed ties string
+        benchmark = render.join(iv_data["benchmark"])
+        speed_ties = render.join(iv_data["speedties"])
+
+        # Generate spread string
+        spread_string = util.build_spread_string(
+            iv, 0, CONFIG.NATURE_NEUTRAL
+        )
+
+        # Add row for spread to report
+        content.append(
+            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
+        )
+
+    # Sort the neutral ivs from highest to lowest
+    iv_neg_sorted = list(iv_negative.keys())
+    iv_neg_sorted.sort(reverse=True)
+
+    # Loop over the sorted ivs
+    for iv in iv_neg_sorted:
+        # Get the data from the report
+        iv_data = iv_negative[iv]
+        stat = iv_data["stat"]
+        jump = iv_data["jump"]
+
+        # Build the benchmarks, speed ties string
+        benchmark = render.join(iv_data["benchmark"])
+        speed_ties = render.join(iv_data["speedties"])
+
+        # Generate spread string
+        spread_string = util.build_spread_string(
+            iv, 0, CONFIG.NATURE_NEGATIVE
+        )
+
+        # Add row for spread to report
+        content.append(
+            f"| {spread_string} | {stat} | {jump} | {benchmark} | {speed_ties} |"
+        )
+
+    # Loop over the full search sections (if searched)
+    for key in ["positive_spread", "neutral_spread", "negative_spread"]:
+        # Section was not searched
+        if key not in report:
+            continue
+
+        # Get the section from the report
+        section = report[key]
+
+        # Sort the points from highest to lowest
+        points_sorted = list(section.keys())
+        points_sorted.sort(reverse=True)
+
+        # Loop over the sorted points
+        for points in points_sorted:
+            # Get the data from the report
+            spread_data = section[points]
+            stat = spread_data["stat"]
+            jump = spread_data["jump"]
+
+            # Build the spreads, benchmarks, speed ties string
+            spreads = ", ".join(spread_data["spreads"])
+            benchmark = render.join(spread_data["benchmark"])
+            speed_ties = render.join(spread_data["speedties"])
+
+            # Add row for spreads to report
+            content.append(
+                f"| {spreads} | {stat} | {jump} | {benchmark} | {speed_ties} |"
+            )
+
+    # Join the output contents
+    return "\n".join(content)
+
+
+def get_report_paths(name, output_folder):
+    # Report file paths
+    paths = []
+
+    # Export species to json format
+    if CONFIG.SPECIES_JSON == True:
+        paths.append(os.path.join(output_folder, f"{name}.json"))
+
+    # Export species to markdown format
+    if CONFIG.SPECIES_MD == True:
+        paths.append(os.path.join(output_folder, f"{name}.md"))
+
+    # Return the report file paths
+    return paths
+
+
+def write_species_report(report, output_folder, render=None, tier_index=None):
+    # No shared render cache, render this report on its own
+    if render == None:
+        render = RenderCache(CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT)
+
+    # Get the species name
+    name = report["species"]["name"]
+
+    # Number of bytes written
+    written = 0
+
+    # Export species to json format
+    if CONFIG.SPECIES_JSON == True:
+        # Compact json reports reference the speed tiers by stat
+        if getattr(CONFIG, "SPECIES_JSON_COMPACT", False) == True:
+            json_report = compact_species_report(report, tier_index)
+        else:
+            json_report = report
+
+        # Generate a json string from the table (reusing the encoded benchmarks)
+        output = render.encode(json_report)
+
+        # Generate output json file full path
+        json_path = os.path.join(output_folder, f"{name}.json")
+
+        # Write the report, unless the content is unchanged
+        written += cache.write_if_changed(json_path, output)
+
+    # Export species to markdown format
+    if CONFIG.SPECIES_MD == True:
+        # Build the markdown report
+        output = build_species_markdown(report, render)
+
+        # Generate output md file full path
+        md_path = os.path.join(output_folder, f"{name}.md")
+
+        # Write the report, unless the content is unchanged
+        written += cache.write_if_changed(md_path, output)
+
+    # Return the number of bytes written
+    return written
+
+
+# Worker process state, set once per
+# worker by the pool initializer
+WORKER_STATE = {}
+
+
+def init_worker(speed_tiers, level, output_folder, profile=False, full_search=False):
+    # Build the speed tier index once per worker
+    WORKER_STATE["tier_index"] = SpeedTierIndex(speed_tiers)
+    WORKER_STATE["level"] = level
+    WORKER_STATE["output_folder"] = output_folder
+    WORKER_STATE["full_search"] = full_search
+    WORKER_STATE["profile"] = profile
+
+    # Rendered benchmarks, shared by every report in the worker
+    WORKER_STATE["render"] = RenderCache(CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT)
+
+    # Trace memory allocations in the worker
+    if profile == True:
+        tracemalloc.start()
+
+
+def process_species(species):
+    # Start timing the report
+    wall = time.perf_counter()
+    cpu = time.process_time()
+
+    # Reset the worker peak memory
+    if WORKER_STATE.get("profile") == True:
+        tracemalloc.reset_peak()
+
+    # Build the report using the shared worker state
+    report = build_species_report(
+        species,
+        WORKER_STATE["tier_index"],
+        WORKER_STATE["level"],
+        WORKER_STATE.get("full_search", False),
+    )
+
+    # Write the report files
+    written = write_species_report(
+        report,
+        WORKER_STATE["output_folder"],
+        WORKER_STATE.get("render"),
+        WORKER_STATE["tier_index"],
+    )
+
+    # Return the processed species name, metrics
+    return {
+        "name": species["name"],
+        "bytes": written,
+        "wall": time.perf_counter() - wall,
+        "cpu": time.process_time() - cpu,
+        "peak": (
+            tracemalloc.get_traced_memory()[1]
+            if WORKER_STATE.get("profile") == True
+            else None
+        ),
+    }
+
+
+def generate_reports(
+    species_list,
+    tier_index,
+    level,
+    output_folder,
+    jobs=1,
+    profiler=None,
+    full_search=False,
+):
+    # Profiling is enabled
+    profile = profiler != None and profiler.enabled
+
+    # Single job, process in the current process
+    if jobs == 1:
+        # Share the existing index with the in-process worker
+        WORKER_STATE["tier_index"] = tier_index
+        WORKER_STATE["level"] = level
+        WORKER_STATE["output_folder"] = output_folder
+        WORKER_STATE["full_search"] = full_search
+        WORKER_STATE["profile"] = False
+
+        # Rendered benchmarks, shared by every report
+        WORKER_STATE["render"] = RenderCache(CONFIG.JSON_SORT_KEYS, CONFIG.JSON_INDENT)
+
+        # Loop over the species
+        for species in species_list:
+            # Profiling is enabled
+            if profile == True:
+                # Profile the report in the current process
+                with profiler.phase(f"report:{species['name']}"):
+                    result = process_species(species)
+            else:
+                result = process_species(species)
+
+            # Yield the processed species result
+            yield result
+
+        return
+
+    # Zero (or fewer) jobs, use all of the available cpus
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+
+    # Speed tiers are sent to each worker once, via the initializer
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_worker,
+        initargs=(tier_index.speed_tiers, level, output_folder, profile, full_search),
+    ) as executor:
+        # Split the species into a few chunks per worker
+        chunksize = max(1, len(species_list) // (jobs * 4))
+
+        # Loop over the completed species
+        for result in executor.map(process_species, species_list, chunksize=chunksize):
+            # Profiling is enabled
+            if profile == True:
+                # Record the report profiled by the worker
+                profiler.record(
+                    f"report:{result['name']}", result["wall"], result["cpu"], result["peak"]
+                )
+
+            # Yield the processed species result
+            yield result
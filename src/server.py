@@ -0,0 +1,129 @@
+# Species Reports
+import src.report as report
+
+# JSON library
+import json as JSON
+
+# Math Library
+import math
+
+# HTTP Server
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+# Cache Decorator
+from functools import lru_cache
+
+# Default server settings
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Maximum number of species reports kept in memory
+REPORT_CACHE_SIZE = 512
+
+
+def encode_json(data):
+    # Encode the data as compact json
+    return JSON.dumps(data, separators=(",", ":")).encode("utf8")
+
+
+def create_handler(pokemon, tier_index, level, cache_size=REPORT_CACHE_SIZE):
+    # Build (and cache) the encoded report for a species
+    @lru_cache(maxsize=cache_size)
+    def get_report(key):
+        return encode_json(report.build_species_report(pokemon[key], tier_index, level))
+
+    class SpeedTierHandler(BaseHTTPRequestHandler):
+        def send_json(self, status, body):
+            # Send the response headers
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            # Send the response body
+            self.wfile.write(body)
+
+        def send_error_json(self, status, message):
+            # Send the error message as json
+            self.send_json(status, encode_json({"error": message}))
+
+        def do_GET(self):
+            # Split the request path, query
+            url = urlparse(self.path)
+            parts = [unquote(part) for part in url.path.split("/") if part != ""]
+            query = parse_qs(url.query)
+
+            try:
+                # Tier listing: /tiers?min=100&max=200
+                if parts == ["tiers"]:
+                    # Range limits (defaults to every tier)
+                    low = int(query["min"][0]) if "min" in query else -math.inf
+                    high = int(query["max"][0]) if "max" in query else math.inf
+
+                    # Build the tiers in the range
+                    body = {
+                        stat: tier_index[stat] for stat in tier_index.in_range(low, high)
+                    }
+                    return self.send_json(200, encode_json(body))
+
+                # Single tier: /tiers/167
+                if len(parts) == 2 and parts[0] == "tiers":
+                    # Get the tier stat
+                    stat = int(parts[1])
+
+                    # Stat is not a speed tier
+                    if stat not in tier_index:
+                        return self.send_error_json(404, f"No speed tier for stat {stat}!")
+
+                    # Build the tier data
+                    body = {"stat": stat, "benchmarks": tier_index[stat]}
+                    return self.send_json(200, encode_json(body))
+
+                # Species report: /species/kangaskhanmega
+                if len(parts) == 2 and parts[0] == "species":
+                    # Get the species key
+                    key = parts[1]
+
+                    # Species does not exist
+                    if key not in pokemon:
+                        return self.send_error_json(404, f"Unknown species '{key}'!")
+
+                    # Send the (cached) species report
+                    return self.send_json(200, get_report(key))
+            except ValueError:
+                # Invalid number in the request
+                return self.send_error_json(400, "Invalid stat value!")
+
+            # Unknown path
+            self.send_error_json(404, f"Unknown path '{url.path}'!")
+
+        def log_message(self, format, *args):
+            # Silence per-request logging
+            pass
+
+    # Return the request handler
+    return SpeedTierHandler
+
+
+def create_server(pokemon, tier_index, level, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    # Create the request handler
+    handler = create_handler(pokemon, tier_index, level)
+
+    # Return the http server
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(pokemon, tier_index, level, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    # Create the http server
+    server = create_server(pokemon, tier_index, level, host, port)
+
+    print(f"Serving speed tiers on http://{host}:{server.server_port} ...")
+
+    try:
+        # Handle requests until interrupted
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,65 +1,289 @@
 # Global Imports
 import json as JSON
 import requests
+import requests.adapters
+import hashlib
+import pickle
 import os
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
-def get_showdown_data(force=False):
+# Showdown data server
+SHOWDOWN_URL = "https://play.pokemonshowdown.com/data"
 
-    # Moves Data
-    moves = {}
+# Local data folder
+DATA_FOLDER = "data"
 
-    # Create the data directory
-    os.makedirs("data", exist_ok=True)
+# Showdown data files
+DATA_FILES = ["moves.json", "pokedex.json"]
 
-    # Moves Filename
-    moves_file = os.path.join("data", "moves.json")
+# Download metadata (etag, last modified) file
+METADATA_FILE = "metadata.json"
 
-    # Force switch set, or moves file not present
-    if force or not os.path.exists(moves_file):
-        # Download the file from the server, and save it to the data folder
-        request = requests.get("https://play.pokemonshowdown.com/data/moves.json")
+# Download settings
+REQUEST_TIMEOUT = 30
+DOWNLOAD_WORKERS = len(DATA_FILES)
+DOWNLOAD_CHUNK_SIZE = 65536
 
-        # Get json data
-        content = request.content
+# Snapshot format version, increment
+# to invalidate existing snapshots
+SNAPSHOT_VERSION = 1
 
-        # Load moves from json data
-        moves = JSON.loads(content)
 
-        with open(moves_file, "w+") as file:
-            # Write json data to file
-            JSON.dump(moves, file)
+class LazyData(Mapping):
+    def __init__(self, loader):
+        # Function which loads the data
+        self.loader = loader
 
-    else:  # File already exists
-        with open(moves_file, "r") as file:
-            # Read json data from file
-            moves = JSON.load(file)
+        # Loaded data (None until first accessed)
+        self.data = None
+
+    def load(self):
+        # Data has not been loaded yet
+        if self.data == None:
+            self.data = self.loader()
+
+        # Return the loaded data
+        return self.data
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
 
-    # Pokedex data
-    dex = {}
+    def __contains__(self, key):
+        return key in self.load()
 
-    # Pokedex Filename
-    dex_file = os.path.join("data", "pokedex.json")
 
-    # Force switch set, or dex file not present
-    if force or not os.path.exists(dex_file):
-        # Download the file from the server, and save it to the data folder
-        request = requests.get("https://play.pokemonshowdown.com/data/pokedex.json")
+def hash_file(path):
+    # Open the file in binary mode
+    with open(path, "rb") as file:
+        # Return the file content hash
+        return hashlib.sha256(file.read()).hexdigest()
 
-        # Get json data
-        content = request.content
 
-        # Load dex from json data
-        dex = JSON.loads(content)
+def load_metadata():
+    # Build the path to the metadata file
+    metadata_file = os.path.join(DATA_FOLDER, METADATA_FILE)
 
-        with open(dex_file, "w+") as file:
-            # Write json data to file
-            JSON.dump(dex, file)
+    # Metadata file does not exist
+    if not os.path.exists(metadata_file):
+        return {}
 
-    else:  # File already exists
-        with open(dex_file, "r") as file:
+    try:
+        # Open the metadata file
+        with open(metadata_file, "r") as file:
             # Read json data from file
-            dex = JSON.load(file)
+            return JSON.load(file)
+    except (OSError, ValueError):
+        # Unreadable metadata, ignore it
+        return {}
+
+
+def save_metadata(metadata):
+    # Build the path to the metadata file
+    metadata_file = os.path.join(DATA_FOLDER, METADATA_FILE)
+
+    with open(metadata_file, "w+") as file:
+        # Write json data to file
+        JSON.dump(metadata, file, indent=2)
+
+
+def create_session(pool_size=DOWNLOAD_WORKERS):
+    # Create a session, with a connection pool for the data server
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Return the session
+    return session
+
+
+def download_data(session, filename, file_metadata, base_url=SHOWDOWN_URL):
+    # Build the path to the data file
+    data_file = os.path.join(DATA_FOLDER, filename)
+
+    # Conditional request headers
+    headers = {}
+
+    # Only validate against the server if the file exists
+    if os.path.exists(data_file):
+        # Entity tag from the last download
+        if file_metadata.get("etag") != None:
+            headers["If-None-Match"] = file_metadata["etag"]
+
+        # Last modified date from the last download
+        if file_metadata.get("last_modified") != None:
+            headers["If-Modified-Since"] = file_metadata["last_modified"]
+
+    # Download the file from the server
+    with session.get(
+        f"{base_url}/{filename}",
+        headers=headers,
+        stream=True,
+        timeout=REQUEST_TIMEOUT,
+    ) as response:
+        # File has not changed on the server
+        if response.status_code == 304:
+            return file_metadata
+
+        # Raise an error for failed requests
+        response.raise_for_status()
+
+        # Stream the response to a temporary file, then swap it in
+        temp_file = f"{data_file}.tmp"
+        with open(temp_file, "wb") as file:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(temp_file, data_file)
+
+        # Return the validators for the next download
+        return {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+
+def refresh_data(filenames, base_url=SHOWDOWN_URL):
+    # No files to refresh
+    if len(filenames) == 0:
+        return
+
+    # Load the stored download metadata
+    metadata = load_metadata()
+
+    # Download the files concurrently, over a shared session
+    with create_session() as session:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            # Start each of the downloads
+            futures = {
+                filename: executor.submit(
+                    download_data,
+                    session,
+                    filename,
+                    metadata.get(filename, {}),
+                    base_url,
+                )
+                for filename in filenames
+            }
+
+            # Loop over the downloads
+            for filename, future in futures.items():
+                # Update the download metadata
+                metadata[filename] = future.result()
+
+    # Save the updated download metadata
+    save_metadata(metadata)
+
+
+def load_snapshot(snapshot_file, stat, content_hash=None):
+    # Snapshot file does not exist
+    if not os.path.exists(snapshot_file):
+        return None
+
+    try:
+        # Open the snapshot file
+        with open(snapshot_file, "rb") as file:
+            # Read the snapshot header
+            header = pickle.load(file)
+
+            # Snapshot was written by a different version
+            if header.get("version") != SNAPSHOT_VERSION:
+                return None
+
+            # Source file is unchanged (same mtime, size)
+            if header["mtime"] == stat.st_mtime_ns and header["size"] == stat.st_size:
+                return pickle.load(file)
+
+            # Source file was touched, but the content is the same
+            if content_hash != None and header["hash"] == content_hash:
+                return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError):
+        # Unreadable snapshot, rebuild it
+        return None
+
+    # Snapshot is out of date
+    return None
+
+
+def save_snapshot(snapshot_file, stat, content_hash, data):
+    # Snapshot header
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "hash": content_hash,
+    }
+
+    # Write to a temporary file, then swap it in
+    temp_file = f"{snapshot_file}.tmp"
+    with open(temp_file, "wb") as file:
+        # Write the header, then the data
+        pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, snapshot_file)
+
+
+def load_data(filename):
+    # Build the path to the data file, snapshot
+    data_file = os.path.join(DATA_FOLDER, filename)
+    snapshot_file = f"{data_file}.snapshot"
+
+    # Get the data file metadata
+    stat = os.stat(data_file)
+
+    # Try the snapshot using the file metadata
+    data = load_snapshot(snapshot_file, stat)
+    if data != None:
+        return data
+
+    # Metadata has changed, compare the file content hash
+    content_hash = hash_file(data_file)
+    data = load_snapshot(snapshot_file, stat, content_hash)
+
+    # Content is unchanged
+    if data != None:
+        # Refresh the snapshot metadata
+        save_snapshot(snapshot_file, stat, content_hash, data)
+        return data
+
+    with open(data_file, "r") as file:
+        # Read json data from file
+        data = JSON.load(file)
+
+    # Save the snapshot for the next load
+    save_snapshot(snapshot_file, stat, content_hash, data)
+
+    # Return the data
+    return data
+
+
+def get_showdown_data(force=False, base_url=SHOWDOWN_URL):
+
+    # Create the data directory
+    os.makedirs(DATA_FOLDER, exist_ok=True)
+
+    # Force switch set (all files), or files not present
+    filenames = [
+        filename
+        for filename in DATA_FILES
+        if force or not os.path.exists(os.path.join(DATA_FOLDER, filename))
+    ]
+
+    # Download the files from the server, and save them to the data folder
+    refresh_data(filenames, base_url)
+
+    # Data is parsed when it is first accessed
+    moves = LazyData(lambda: load_data("moves.json"))
+    dex = LazyData(lambda: load_data("pokedex.json"))
 
     # Return data
     return moves, dex
@@ -0,0 +1,151 @@
+# Utility Functions
+import src.util as util
+
+# Math Library
+import math
+
+# Function Tools
+import functools
+
+# Investment Limits
+MAX_EVS = 252
+MAX_IVS = 31
+
+
+def min_stat_value(target, nature):
+    # Smallest pre-nature stat value which
+    # reaches the target after the nature
+    value = math.ceil(target / nature)
+
+    # Correct for floating point rounding
+    while math.floor((value - 1) * nature) >= target:
+        value -= 1
+    while math.floor(value * nature) < target:
+        value += 1
+
+    # Return the pre-nature stat value
+    return value
+
+
+def min_points(base_stat, level, target, nature):
+    # Smallest pre-nature stat value required
+    value = min_stat_value(target, nature)
+
+    # Invert ((2 * base + points) * level) // 100 + 5 >= value
+    points = -(-100 * (value - 5) // level) - 2 * base_stat
+
+    # Return the combined iv + (ev // 4) points required
+    return max(points, 0)
+
+
+def min_evs(base_stat, level, target, nature, ivs=MAX_IVS):
+    # Points which must come from evs
+    points = max(min_points(base_stat, level, target, nature) - ivs, 0)
+
+    # Evs required for the points
+    evs = points * 4
+
+    # Not reachable with evs
+    if evs > MAX_EVS:
+        return None
+
+    # Return the minimum evs
+    return evs
+
+
+def min_ivs(base_stat, level, target, nature, evs=0):
+    # Points which must come from ivs
+    ivs = max(min_points(base_stat, level, target, nature) - (evs // 4), 0)
+
+    # Not reachable with ivs
+    if ivs > MAX_IVS:
+        return None
+
+    # Return the minimum ivs
+    return ivs
+
+
+@functools.lru_cache(maxsize=None)
+def ev_breakpoints(base_stat, level, nature, ivs=MAX_IVS):
+    # Breakpoints table (evs -> stat)
+    breakpoints = {}
+
+    # Lowest, highest reachable stats
+    low = util.calculate_stat(base_stat, level, ivs, 0, nature)
+    high = util.calculate_stat(base_stat, level, ivs, MAX_EVS, nature)
+
+    # Loop over the reachable stats
+    for target in range(low, high + 1):
+        # Minimum evs which reach the stat
+        evs = min_evs(base_stat, level, target, nature, ivs)
+
+        # Stats skipped by a jump share their evs with the next stat
+        breakpoints[evs] = util.calculate_stat(base_stat, level, ivs, evs, nature)
+
+    # Return breakpoints, lowest investment first
+    return list(breakpoints.items())
+
+
+@functools.lru_cache(maxsize=None)
+def iv_breakpoints(base_stat, level, nature, evs=0):
+    # Breakpoints table (ivs -> stat)
+    breakpoints = {}
+
+    # Lowest, highest reachable stats
+    low = util.calculate_stat(base_stat, level, 0, evs, nature)
+    high = util.calculate_stat(base_stat, level, MAX_IVS, evs, nature)
+
+    # Loop over the reachable stats
+    for target in range(low, high + 1):
+        # Minimum ivs which reach the stat
+        ivs = min_ivs(base_stat, level, target, nature, evs)
+
+        # Stats skipped by a jump share their ivs with the next stat
+        breakpoints[ivs] = util.calculate_stat(base_stat, level, ivs, evs, nature)
+
+    # Return breakpoints, lowest investment first
+    return list(breakpoints.items())
+
+
+def min_investment_to_outspeed(species, target_stat, nature, level, ivs=MAX_IVS):
+    # Get the base speed for the species
+    base_speed = species["baseStats"]["spe"]
+
+    # Minimum evs to reach one point above the target
+    return min_evs(base_speed, level, target_stat + 1, nature, ivs)
+
+
+# Highest combined iv + (ev // 4) points
+MAX_POINTS = MAX_IVS + MAX_EVS // 4
+
+
+def get_points_spreads(points):
+    # Every (ivs, evs) spread which spends exactly the points
+    # (none of these dominate each other, as less ivs need more evs)
+    return [
+        (ivs, (points - ivs) * 4)
+        for ivs in range(min(points, MAX_IVS), max(points - MAX_EVS // 4, 0) - 1, -1)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def spread_breakpoints(base_stat, level, nature):
+    # Breakpoints table (stat -> points)
+    breakpoints = {}
+
+    # The stat only depends on ivs + (evs // 4), so the full
+    # ivs x evs grid collapses to one stat per points total
+    for points in range(MAX_POINTS + 1):
+        # Spend the points on ivs first, then evs
+        ivs = min(points, MAX_IVS)
+        evs = (points - ivs) * 4
+
+        # Calculate the stat for the points
+        stat = util.calculate_stat(base_stat, level, ivs, evs, nature)
+
+        # Spreads with more points reaching the same stat are dominated
+        if stat not in breakpoints:
+            breakpoints[stat] = points
+
+    # Return breakpoints (points, stat), lowest investment first
+    return [(points, stat) for stat, points in breakpoints.items()]
@@ -0,0 +1,196 @@
+# Binary Structures
+import struct
+
+# Memory Mapped Files
+import mmap
+
+# Typed Arrays
+from array import array
+
+from collections.abc import Mapping
+
+# Binary tier file format
+# header: magic, version, reserved, tier count, record count, string count
+# index: (stat, first record, record count) for each tier, sorted by stat
+# records: string table id for each benchmark, grouped by tier
+# strings: string table offsets (string count + 1), then utf8 string data
+# All values are little-endian unsigned 32 bit integers (4 byte aligned)
+TIERFILE_MAGIC = b"STGT"
+TIERFILE_VERSION = 1
+
+# Section layouts
+HEADER = struct.Struct("<4sHHIII")
+INDEX_ENTRY = struct.Struct("<III")
+VALUE = struct.Struct("<I")
+
+
+def write_tiers_binary(speed_tiers, file):
+    # Shared string table (string -> id)
+    strings = {}
+
+    # Tier index entries, record string ids
+    index = []
+    records = array("I")
+
+    # Loop over the tiers, lowest stat first
+    for stat in sorted(speed_tiers.keys()):
+        # First record for the tier
+        start = len(records)
+
+        # Loop over the benchmarks for the tier
+        for benchmark in speed_tiers[stat]:
+            # Add the benchmark to the string table (once)
+            if benchmark not in strings:
+                strings[benchmark] = len(strings)
+
+            # Add the string id to the records
+            records.append(strings[benchmark])
+
+        # Add the tier to the index
+        index.append((stat, start, len(records) - start))
+
+    # Encode the string table
+    data = [string.encode("utf8") for string in strings]
+
+    # String offsets, relative to the start of the string data
+    offsets = array("I", [0])
+    for item in data:
+        offsets.append(offsets[-1] + len(item))
+
+    # Values are stored little-endian
+    if struct.pack("=I", 1) != VALUE.pack(1):
+        records.byteswap()
+        offsets.byteswap()
+
+    # Write the header
+    file.write(
+        HEADER.pack(
+            TIERFILE_MAGIC, TIERFILE_VERSION, 0, len(index), len(records), len(data)
+        )
+    )
+
+    # Write the tier index
+    for entry in index:
+        file.write(INDEX_ENTRY.pack(*entry))
+
+    # Write the records, string table
+    file.write(records.tobytes())
+    file.write(offsets.tobytes())
+    for item in data:
+        file.write(item)
+
+
+class TierFile(Mapping):
+    def __init__(self, path):
+        # Open the file, and map it into memory (read only)
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Read the header
+        magic, version, _, tiers, records, strings = HEADER.unpack_from(self.data, 0)
+
+        # Not a binary tier file
+        if magic != TIERFILE_MAGIC:
+            raise ValueError(f"'{path}' is not a binary tier file!")
+
+        # File is from a different version
+        if version != TIERFILE_VERSION:
+            raise ValueError(f"Unsupported binary tier file version {version} in '{path}'!")
+
+        # Number of tiers, records, strings
+        self.tiers = tiers
+        self.records = records
+        self.strings = strings
+
+        # Section offsets
+        self.index_offset = HEADER.size
+        self.records_offset = self.index_offset + tiers * INDEX_ENTRY.size
+        self.offsets_offset = self.records_offset + records * VALUE.size
+        self.strings_offset = self.offsets_offset + (strings + 1) * VALUE.size
+
+    def get_stat(self, position):
+        # Stat of the tier at the index position
+        return VALUE.unpack_from(self.data, self.index_offset + position * INDEX_ENTRY.size)[0]
+
+    def find(self, stat):
+        # Binary search the index for the first tier >= stat
+        low, high = 0, self.tiers
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_stat(middle) < stat:
+                low = middle + 1
+            else:
+                high = middle
+
+        # Return the index position
+        return low
+
+    def get_string(self, string_id):
+        # Start, end of the string data
+        start, end = struct.unpack_from(
+            "<II", self.data, self.offsets_offset + string_id * VALUE.size
+        )
+
+        # Decode the string
+        return self.data[self.strings_offset + start : self.strings_offset + end].decode(
+            "utf8"
+        )
+
+    def read_tier(self, position):
+        # Get the tier index entry
+        _, start, count = INDEX_ENTRY.unpack_from(
+            self.data, self.index_offset + position * INDEX_ENTRY.size
+        )
+
+        # Read the string ids for the tier
+        string_ids = struct.unpack_from(
+            f"<{count}I", self.data, self.records_offset + start * VALUE.size
+        )
+
+        # Return the benchmark strings
+        return [self.get_string(string_id) for string_id in string_ids]
+
+    def in_range(self, low, high):
+        # Stats between low and high (inclusive)
+        stats = []
+
+        # Loop over the tiers from the first stat >= low
+        for position in range(self.find(low), self.tiers):
+            # Past the end of the range
+            stat = self.get_stat(position)
+            if stat > high:
+                break
+
+            # Add the stat to the list
+            stats.append(stat)
+
+        # Return the stats
+        return stats
+
+    def __getitem__(self, stat):
+        # Find the position of the stat
+        position = self.find(stat)
+
+        # Stat is not in the tiers
+        if position == self.tiers or self.get_stat(position) != stat:
+            raise KeyError(stat)
+
+        # Return the benchmarks for the stat
+        return self.read_tier(position)
+
+    def __iter__(self):
+        # Stats, lowest first
+        return (self.get_stat(position) for position in range(self.tiers))
+
+    def __len__(self):
+        return self.tiers
+
+    def close(self):
+        # Unmap the file
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
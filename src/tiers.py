@@ -0,0 +1,119 @@
+# Bisect Library
+import bisect
+
+
+class BenchmarkList(list):
+    __slots__ = ["key"]
+
+    def __init__(self, key, items=()):
+        super().__init__(items)
+
+        # Stat range (low, high) of the benchmarks, used as the render cache key
+        self.key = key
+
+
+class SpeedTierIndex:
+    def __init__(self, speed_tiers):
+        # Speed tiers table (stat -> benchmarks)
+        self.speed_tiers = speed_tiers
+
+        # Speed stats, sorted from slowest to fastest
+        self.stats = sorted(speed_tiers.keys())
+
+        # Benchmarks for each stat, formatted on first access
+        self.formatted = {}
+
+        # Benchmarks for each stat range, built on first access
+        self.ranges = {}
+
+        # Species report sections for each base speed, built
+        # on first access (see report.build_species_report)
+        self.sections = {}
+
+        # Compact report sections, by full section key
+        # (see report.compact_species_report)
+        self.compact = {}
+
+    def __contains__(self, stat):
+        # Exact stat lookup (hash based)
+        return stat in self.speed_tiers
+
+    def __getitem__(self, stat):
+        # Benchmarks have not been formatted yet
+        if stat not in self.formatted:
+            self.formatted[stat] = self.speed_tiers[stat]
+
+        # Benchmarks for the exact stat
+        return self.formatted[stat]
+
+    def __len__(self):
+        # Number of distinct speed tiers
+        return len(self.stats)
+
+    def get(self, stat, default=None):
+        # Stat is not a speed tier
+        if stat not in self.speed_tiers:
+            return default
+
+        # Benchmarks for the exact stat
+        return self[stat]
+
+    def sorted_stats(self, reverse=False):
+        # Descending order
+        if reverse == True:
+            return self.stats[::-1]
+
+        # Ascending order
+        return list(self.stats)
+
+    def between(self, low, high):
+        # Stats strictly between low and high, slowest first
+        start = bisect.bisect_right(self.stats, low)
+        end = bisect.bisect_left(self.stats, high)
+
+        # Return the stats within the range
+        return self.stats[start:end]
+
+    def in_range(self, low, high):
+        # Stats between low and high (inclusive), slowest first
+        start = bisect.bisect_left(self.stats, low)
+        end = bisect.bisect_right(self.stats, high)
+
+        # Return the stats within the range
+        return self.stats[start:end]
+
+    def next_above(self, stat):
+        # Position of the first stat greater than the given stat
+        position = bisect.bisect_right(self.stats, stat)
+
+        # No faster tier
+        if position >= len(self.stats):
+            return None
+
+        # Return the next faster tier
+        return self.stats[position]
+
+    def next_below(self, stat):
+        # Position of the first stat greater or equal to the given stat
+        position = bisect.bisect_left(self.stats, stat)
+
+        # No slower tier
+        if position == 0:
+            return None
+
+        # Return the next slower tier
+        return self.stats[position - 1]
+
+    def benchmarks(self, low, high):
+        # Benchmarks for the range have not been built yet
+        if (low, high) not in self.ranges:
+            # Join the benchmarks for the stats in the range
+            benchmarks = BenchmarkList((low, high))
+            for stat in self.in_range(low, high):
+                benchmarks += self[stat]
+
+            self.ranges[(low, high)] = benchmarks
+
+        # Benchmarks for the stats between low and high (inclusive),
+        # shared by every report which reaches the same range
+        return self.ranges[(low, high)]
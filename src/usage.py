@@ -0,0 +1,339 @@
+# Utility Functions
+import src.util as util
+
+# Speed Modifiers
+import src.modifiers as modifiers
+
+# JSON library
+import json as JSON
+
+# Regular Expressions
+import re
+
+# Usage file read size (characters)
+CHUNK_SIZE = 1024 * 1024
+
+# Speed percentiles reported for each species, and the whole format
+PERCENTILES = [10, 25, 50, 75, 90]
+
+# Natures which raise / lower speed (all others are neutral)
+SPEED_NATURES = {
+    "timid": util.NATURE_POSITIVE,
+    "hasty": util.NATURE_POSITIVE,
+    "jolly": util.NATURE_POSITIVE,
+    "naive": util.NATURE_POSITIVE,
+    "brave": util.NATURE_NEGATIVE,
+    "relaxed": util.NATURE_NEGATIVE,
+    "quiet": util.NATURE_NEGATIVE,
+    "sassy": util.NATURE_NEGATIVE,
+}
+
+# Speed items in the usage stats (item id -> modifier set)
+SPEED_ITEMS = {
+    "choicescarf": modifiers.ModifierSet(0, ["scarf"]),
+    "ironball": modifiers.ModifierSet(0, ["ironball"]),
+}
+
+# No speed item
+NO_ITEM = modifiers.ModifierSet()
+
+# Usage stats do not include ivs
+USAGE_IVS = 31
+
+# Whitespace / separators between values
+SEPARATORS = re.compile(r"[\s,:]*")
+
+
+def to_id(name):
+    # Showdown id (e.g. 'Kangaskhan-Mega' -> 'kangaskhanmega')
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+class ChaosReader:
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        # Usage file, read size
+        self.file = file
+        self.chunk_size = chunk_size
+
+        # Unread text, current position
+        self.buffer = ""
+        self.position = 0
+
+        # End of the file has been reached
+        self.eof = False
+
+    def read(self):
+        # Drop the text which has already been read
+        self.buffer = self.buffer[self.position :]
+        self.position = 0
+
+        # Read at least as much as is buffered, so
+        # retrying a large value is linear overall
+        chunk = self.file.read(max(self.chunk_size, len(self.buffer)))
+
+        # End of the file
+        if chunk == "":
+            self.eof = True
+
+        # Add the chunk to the buffer
+        self.buffer += chunk
+
+    def skip(self):
+        # Skip whitespace, separators (reading more if needed)
+        while True:
+            self.position = SEPARATORS.match(self.buffer, self.position).end()
+
+            # Non-separator found, or end of the file
+            if self.position < len(self.buffer) or self.eof == True:
+                return
+
+            self.read()
+
+    def peek(self):
+        # Next non-separator character (empty at the end of the file)
+        self.skip()
+        return self.buffer[self.position : self.position + 1]
+
+    def expect(self, character):
+        # Next character is not the expected one
+        if self.peek() != character:
+            raise ValueError(f"Invalid usage file, expected '{character}'!")
+
+        # Move past the character
+        self.position += 1
+
+    def value(self):
+        # Skip to the start of the value
+        self.skip()
+
+        # Decode the next value, reading more until it is complete
+        while True:
+            try:
+                value, end = JSON.JSONDecoder().raw_decode(self.buffer, self.position)
+
+                # Value ends at the end of the buffer (may be truncated)
+                if end < len(self.buffer) or self.eof == True:
+                    self.position = end
+                    return value
+            except JSON.JSONDecodeError:
+                # Value is invalid
+                if self.eof == True:
+                    raise
+
+            self.read()
+
+    def items(self):
+        # Start of the object
+        self.expect("{")
+
+        # Loop until the end of the object
+        while self.peek() != "}":
+            # Yield the key (the caller reads the value)
+            yield self.value()
+
+        # End of the object
+        self.expect("}")
+
+
+def iter_chaos_species(file, chunk_size=CHUNK_SIZE):
+    # Incremental reader for the usage file
+    reader = ChaosReader(file, chunk_size)
+
+    # Loop over the top level keys
+    for key in reader.items():
+        # Not the species data, skip the value
+        if key != "data":
+            reader.value()
+            continue
+
+        # Loop over the species, decoding one at a time
+        for name in reader.items():
+            yield name, reader.value()
+
+
+def get_speed_weights(data, base_speed, level):
+    # Speed stat / modifier -> share of the species
+    weights = {}
+
+    # Spreads, items used by the species
+    spreads = data.get("Spreads", {})
+    items = data.get("Items", {})
+
+    # Total spread, item weights
+    spread_total = sum(spreads.values())
+    item_total = sum(items.values())
+
+    # No spreads recorded
+    if spread_total == 0:
+        return weights
+
+    # Share of each speed item (spreads and items are independent in the stats)
+    item_shares = {}
+    if item_total > 0:
+        for item, modifier_set in SPEED_ITEMS.items():
+            if items.get(item, 0) > 0:
+                item_shares[modifier_set] = items[item] / item_total
+
+    # No speed item share
+    item_shares[NO_ITEM] = 1 - sum(item_shares.values())
+
+    # Loop over the spreads (e.g. 'Jolly:4/252/0/0/0/252')
+    for spread, weight in spreads.items():
+        # Nature, speed evs
+        nature, evs = spread.split(":")
+        speed_evs = int(evs.split("/")[5])
+
+        # Calculate the speed stat
+        stat = util.calculate_stat(
+            base_speed,
+            level,
+            USAGE_IVS,
+            speed_evs,
+            SPEED_NATURES.get(nature.lower(), util.NATURE_NEUTRAL),
+        )
+
+        # Loop over the speed items
+        for modifier_set, share in item_shares.items():
+            # Apply the item to the stat
+            key = (modifier_set.apply(stat), modifier_set.prefix)
+
+            # Add the weight to the stat
+            weights[key] = weights.get(key, 0) + share * weight / spread_total
+
+    # Return the speed weights
+    return weights
+
+
+def get_percentiles(weights, percentiles=PERCENTILES):
+    # Total weight
+    total = sum(weights.values())
+
+    # Percentile -> stat
+    result = {}
+
+    # No weight
+    if total == 0:
+        return result
+
+    # Cumulative weight, remaining percentiles
+    cumulative = 0
+    remaining = sorted(percentiles)
+
+    # Loop over the stats, slowest first
+    for stat in sorted(weights):
+        cumulative += weights[stat]
+
+        # Percentiles reached at this stat
+        while len(remaining) > 0 and cumulative >= total * remaining[0] / 100:
+            result[remaining.pop(0)] = stat
+
+    # Percentiles lost to rounding
+    for percentile in remaining:
+        result[percentile] = max(weights)
+
+    # Return the percentiles
+    return result
+
+
+def build_usage_tiers(file, pokemon, level, chunk_size=CHUNK_SIZE):
+    # Speed stat -> [(benchmark, weight)]
+    tiers = {}
+
+    # Species name -> speed percentiles
+    species_percentiles = {}
+
+    # Speed stat -> usage weight (whole format)
+    totals = {}
+
+    # Loop over the species in the usage stats
+    for name, data in iter_chaos_species(file, chunk_size):
+        # Species is not in the pokedex
+        key = to_id(name)
+        if key not in pokemon:
+            continue
+
+        # Species usage (fraction of teams)
+        usage = data.get("usage", 0)
+
+        # Share of each speed stat for the species
+        weights = get_speed_weights(data, pokemon[key]["baseStats"]["spe"], level)
+
+        # Species speed stat shares (without the item prefixes)
+        stat_weights = {}
+
+        # Loop over the speed stats
+        for (stat, prefix), share in weights.items():
+            # Add the benchmark to the tier
+            tiers.setdefault(stat, []).append(
+                (f"{prefix}{pokemon[key]['name']}", share * usage)
+            )
+
+            # Add the share to the species, format totals
+            stat_weights[stat] = stat_weights.get(stat, 0) + share
+            totals[stat] = totals.get(stat, 0) + share * usage
+
+        # Get the speed percentiles for the species
+        species_percentiles[pokemon[key]["name"]] = get_percentiles(stat_weights)
+
+    # Total usage weight (so the weights are a share of the format)
+    total = sum(totals.values()) or 1
+
+    # Loop over the tiers
+    for stat, benchmarks in tiers.items():
+        # Normalise the weights, and sort the benchmarks, most used first
+        tiers[stat] = sorted(
+            [(name, weight / total) for name, weight in benchmarks],
+            key=lambda benchmark: benchmark[1],
+            reverse=True,
+        )
+
+    # Return the usage tiers, percentiles
+    return {
+        "tiers": tiers,
+        "percentiles": get_percentiles(totals),
+        "species": species_percentiles,
+    }
+
+
+def write_usage_json(usage, file, sort_keys=True, indent=None):
+    # Usage tiers, with the benchmark weights
+    tiers = {
+        stat: [{"benchmark": name, "weight": weight} for name, weight in benchmarks]
+        for stat, benchmarks in usage["tiers"].items()
+    }
+
+    # Write the usage data to the file
+    JSON.dump(
+        {
+            "tiers": tiers,
+            "percentiles": usage["percentiles"],
+            "species": usage["species"],
+        },
+        file,
+        sort_keys=sort_keys,
+        indent=indent,
+    )
+
+
+def write_usage_markdown(usage, stats, file):
+    # Write the table header
+    file.write("| Speed | Usage | Benchmarks |\n| ----- | ----- | ---------- |")
+
+    # Loop over the sorted stats
+    for stat in stats:
+        # Get the benchmarks for the speed tier
+        benchmarks = usage["tiers"][stat]
+
+        # Total usage weight of the tier
+        total = sum(weight for _, weight in benchmarks)
+
+        # Join the benchmarks, with their usage
+        names = ", ".join(f"{name} ({weight:.2%})" for name, weight in benchmarks)
+
+        # Write the speed tier row
+        file.write(f"\n| {stat} | {total:.2%} | {names} |")
+
+    # Write the percentiles table
+    file.write("\n\n| Percentile | Speed |\n| ---------- | ----- |")
+    for percentile, stat in usage["percentiles"].items():
+        file.write(f"\n| {percentile} | {stat} |")
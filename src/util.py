@@ -1,5 +1,10 @@
 import math
 
+# Nature Effects
+NATURE_POSITIVE = 1.1
+NATURE_NEUTRAL = 1.0
+NATURE_NEGATIVE = 0.9
+
 
 def calculate_hp(base_hp, level, iv, ev):
     return math.floor(((2 * base_hp + iv + (ev // 4)) * level) // 100 + level + 10)
@@ -7,3 +12,60 @@ def calculate_hp(base_hp, level, iv, ev):
 
 def calculate_stat(base_stat, level, iv, ev, nature_multiplier):
     return math.floor((((2 * base_stat + iv + (ev // 4)) * level) // 100 + 5) * nature_multiplier)
+
+
+def build_spread_string(ivs, evs, nature, species=None):
+    # Start building the combo string
+
+    # Add the ivs/evs
+    spread_string = f"{ivs}/{evs}"
+
+    # Positive nature, add plus to string
+    if nature == NATURE_POSITIVE:
+        spread_string = f"{spread_string}+"
+    # Negative nature, add minus to string
+    elif nature == NATURE_NEGATIVE:
+        spread_string = f"{spread_string}-"
+
+    # Species is defined
+    if species:
+        # Add the species name to the combo string
+        spread_string = f"{spread_string} {species}"
+
+    # Return spread string
+    return spread_string
+
+
+def build_stage_string(stage, spread_string):
+    # Stage is greater than zero
+    if stage > 0:
+        # Apply the stage modifier to the string
+        return f"+{stage} {spread_string}"
+
+    # Stage is less than zero
+    if stage < 0:
+        # Apply the stage modifier to the string
+        return f"{stage} {spread_string}"
+
+    # Stage is not applied
+    return spread_string
+
+
+def get_stage_modifier(stage):
+    # Calculate the stage modifier (e.g. +1 = 1.5x, +2 = 2x)
+    return 1 + (abs(stage) * 0.5)
+
+
+def apply_stage(stat, stage):
+    # Stage is greater than zero
+    if stage > 0:
+        # Apply stage modifier to the stat
+        return math.floor(stat * get_stage_modifier(stage))
+
+    # Stage is less than zero
+    if stage < 0:
+        # Apply (inverse) stage modifier to the stat
+        return math.floor(stat / get_stage_modifier(stage))
+
+    # Stat is unchanged
+    return stat